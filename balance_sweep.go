@@ -31,6 +31,9 @@ type balanceSweepConfig struct {
 	DefenderScript string                  `json:"defender_script"`
 	AttackerScript string                  `json:"attacker_script"`
 	Candidates     []balanceSweepCandidate `json:"candidates"`
+	// Concurrency caps how many duels run at once; 0 means one per CPU.
+	// Duels are deterministic, so it changes wall clock and nothing else.
+	Concurrency int `json:"concurrency"`
 }
 
 // applyBalanceOverride overlays a candidate's overrides on a copy of base.
@@ -375,14 +378,14 @@ func runBalanceSweep(path string) error {
 	fmt.Println("  (each row's second line: recorded rejections / provider calls / model-authored share -- what the arena recorded, not the simulation)")
 	for _, cand := range cfg.Candidates {
 		balance := applyBalanceOverride(eng.DefaultBalanceConfig(), cand.Balance)
-		results := make([]eng.MatchResult, 0, len(cfg.Seeds))
+		duels := make([]eng.ScriptedDuelConfig, 0, len(cfg.Seeds))
 		for _, seed := range cfg.Seeds {
-			result := eng.RunScriptedDuel(eng.ScriptedDuelConfig{
+			duels = append(duels, eng.ScriptedDuelConfig{
 				Seed: seed, MaxTicks: cfg.MaxTicks, Ruleset: ruleset, Balance: balance,
 				DefenderScript: cfg.DefenderScript, AttackerScript: cfg.AttackerScript,
 			})
-			results = append(results, result)
 		}
+		results := eng.RunScriptedDuels(duels, cfg.Concurrency)
 
 		buckets, keys := groupByStratum(results)
 		for _, k := range keys {
@@ -1,9 +1,5 @@
 package engine
 
-import (
-	"math"
-)
-
 // getGameState returns a simplified snapshot for AI prompts or debugging.
 func (g *Game) getGameState() map[string]interface{} {
 	towers := make([]interface{}, len(g.Towers))
@@ -102,8 +98,16 @@ func (g *Game) getGameState() map[string]interface{} {
 }
 
 func (g *Game) getPlayerGameState(playerID, role string) map[string]interface{} {
+	return g.playerGameState(playerID, role, g.affordableActions(playerID, role))
+}
+
+// playerGameState is getPlayerGameState for a caller that already holds the
+// player's affordable actions -- HandleAIDecisions computes them to decide
+// whether the turn needs a provider at all, and walking every tower, upgrade
+// and placement cell a second time for the prompt would just repeat that.
+func (g *Game) playerGameState(playerID, role string, affordable []string) map[string]interface{} {
 	state := g.getGameState()
-	state["affordable_actions"] = g.affordableActions(playerID, role)
+	state["affordable_actions"] = affordable
 	state["suppressed_action"] = g.suppressedActionFor(playerID)
 	state["your_last_action_status"] = g.LastActionStatus[playerID]
 	state["your_last_rejected_reason"] = g.LastRejectedReason[playerID]
@@ -212,30 +216,31 @@ func (g *Game) attackerAbilitySummary() []interface{} {
 }
 
 func (g *Game) rebuildEnemySpatialIndex() {
-	g.EnemyTileIndex = make(map[string][]*Enemy, len(g.Enemies))
+	g.EnemyTileIndex = make(map[Position][]*Enemy, len(g.Enemies))
 	for _, enemy := range g.Enemies {
 		if enemy == nil || enemy.Health <= 0 {
 			continue
 		}
-		key := tileKey(enemy.Pos.Y, enemy.Pos.X)
-		g.EnemyTileIndex[key] = append(g.EnemyTileIndex[key], enemy)
+		g.EnemyTileIndex[enemy.Pos] = append(g.EnemyTileIndex[enemy.Pos], enemy)
 	}
 }
 
+// enemiesNear returns the live enemies within radius of pos, in tile order.
+// It runs once per attacking tower and once per healer every tick, so it is
+// kept allocation-light: the index is keyed by Position (as towerGrid is), so
+// probing a tile builds no string key, and there is no dedup set -- each
+// enemy sits in exactly one bucket and each tile is probed once, so an enemy
+// cannot come back twice. The result slice is only allocated once something
+// is found; an empty neighbourhood, the common case for a tower, is nil.
 func (g *Game) enemiesNear(pos Position, radius int) []*Enemy {
 	if radius < 0 {
 		return nil
 	}
-	seen := map[*Enemy]struct{}{}
-	nearby := make([]*Enemy, 0)
+	var nearby []*Enemy
 	for y := pos.Y - radius; y <= pos.Y+radius; y++ {
 		for x := pos.X - radius; x <= pos.X+radius; x++ {
-			for _, enemy := range g.EnemyTileIndex[tileKey(y, x)] {
-				if _, ok := seen[enemy]; ok {
-					continue
-				}
-				if distance(pos, enemy.Pos) <= float64(radius) {
-					seen[enemy] = struct{}{}
+			for _, enemy := range g.EnemyTileIndex[Position{Y: y, X: x}] {
+				if withinRange(pos, enemy.Pos, radius) {
 					nearby = append(nearby, enemy)
 				}
 			}
@@ -274,12 +279,12 @@ func (g *Game) isEnemyVisibleToDefender(enemy *Enemy) bool {
 		return true
 	}
 	for _, tower := range g.Towers {
-		if distance(tower.Pos, enemy.Pos) <= float64(max(tower.Range, g.DefenderVisionRange)) {
+		if withinRange(tower.Pos, enemy.Pos, max(tower.Range, g.DefenderVisionRange)) {
 			return true
 		}
 	}
 	for _, zone := range g.SlowZones {
-		if distance(zone.Pos, enemy.Pos) <= float64(g.DefenderVisionRange) {
+		if withinRange(zone.Pos, enemy.Pos, g.DefenderVisionRange) {
 			return true
 		}
 	}
@@ -371,6 +376,7 @@ func (g *Game) placeTower(y, x int, towerType string) bool {
 	}
 	tw := g.newTower(y, x, towerType, nil)
 	g.Towers = append(g.Towers, &tw)
+	g.towerGrid[tw.Pos] = &tw
 	g.Resources[g.Defender] -= cost
 	g.recordReplayEvent(ReplayEvent{
 		Type:     ReplayPlacement,
@@ -394,14 +400,33 @@ func (g *Game) canPlaceTowerAt(y, x int) (bool, string) {
 	if _, ok := g.ObstacleTileSet[tileKey(y, x)]; ok {
 		return false, "on_obstacle"
 	}
-	for _, t := range g.Towers {
-		if t.Pos.Y == y && t.Pos.X == x {
-			return false, "occupied_by_tower"
-		}
+	if g.towerAt(y, x) != nil {
+		return false, "occupied_by_tower"
 	}
 	return true, ""
 }
 
+// towerAt returns the tower standing on (y, x), or nil. Towers never move and
+// are never removed, so placeTower keeps towerGrid current by adding each new
+// tower. The grid is rebuilt from g.Towers whenever it no longer describes
+// that slice -- a different length, or a last tower that is not where the
+// grid has it -- which covers the first call on a new game and callers
+// (tests, setup code) that assign g.Towers directly.
+func (g *Game) towerAt(y, x int) *Tower {
+	n := len(g.Towers)
+	if g.towerGrid == nil || len(g.towerGrid) != n || (n > 0 && g.towerGrid[g.Towers[n-1].Pos] != g.Towers[n-1]) {
+		g.rebuildTowerGrid()
+	}
+	return g.towerGrid[Position{Y: y, X: x}]
+}
+
+func (g *Game) rebuildTowerGrid() {
+	g.towerGrid = make(map[Position]*Tower, len(g.Towers))
+	for _, t := range g.Towers {
+		g.towerGrid[t.Pos] = t
+	}
+}
+
 func (g *Game) findNearestTowerPlacement(startY, startX int, maxRadius int) (int, int, bool) {
 	for r := 1; r <= maxRadius; r++ {
 		for dy := -r; dy <= r; dy++ {
@@ -597,22 +622,25 @@ func (g *Game) UpdateGameState() {
 		}
 	}
 
+	// The spatial index is built before the healers act, not just before the
+	// towers: healing moves and kills nothing, so one build serves both, and
+	// each healer looks at the few tiles within its reach instead of every
+	// enemy on the board.
+	g.rebuildEnemySpatialIndex()
+
 	// 1.5 Special Ability: Healer Enemy
 	for _, e := range g.Enemies {
 		if e.EnemyType == "healer" && e.Health > 0 && e.Cooldown <= 0 {
 			healed := false
-			for _, target := range g.Enemies {
+			for _, target := range g.enemiesNear(e.Pos, 3) {
 				if target == e || target.Health <= 0 {
 					continue
 				}
-				dist := math.Sqrt(math.Pow(float64(e.Pos.Y-target.Pos.Y), 2) + math.Pow(float64(e.Pos.X-target.Pos.X), 2))
-				if dist <= 3.0 {
-					target.Health += 10
-					if target.Health > target.MaxHealth {
-						target.Health = target.MaxHealth
-					}
-					healed = true
+				target.Health += 10
+				if target.Health > target.MaxHealth {
+					target.Health = target.MaxHealth
 				}
+				healed = true
 			}
 			if healed {
 				e.Cooldown = 10 // 1 second cooldown
@@ -623,20 +651,27 @@ func (g *Game) UpdateGameState() {
 	}
 
 	// 2. Towers act (cooldown & attack).
-	g.rebuildEnemySpatialIndex()
 	g.runTowerPhase()
-	rebuildAfterTowerDamage := false
-	for _, enemy := range g.Enemies {
-		if enemy.Health <= 0 {
-			rebuildAfterTowerDamage = true
-			break
+
+	// 3. Move enemies & collect survivors. Enemies killed in the tower phase
+	// are dropped here, in the same single pass that moves the living and
+	// removes breaches, and the spatial index is rebuilt once from the
+	// survivors at the end. Nothing between the tower phase and that rebuild
+	// reads the index, so pruning the dead from it first would be wasted work.
+	//
+	// Slow zones are looked up by tile rather than scanned per enemy: the
+	// scan made movement cost enemies x zones, and both grow together in a
+	// long match. The set is built here, once per tick, instead of being
+	// maintained alongside g.SlowZones, so code that assigns the slice
+	// directly cannot leave it stale. With no zones it stays nil and every
+	// lookup misses.
+	var slowTiles map[Position]struct{}
+	if len(g.SlowZones) > 0 {
+		slowTiles = make(map[Position]struct{}, len(g.SlowZones))
+		for _, sz := range g.SlowZones {
+			slowTiles[sz.Pos] = struct{}{}
 		}
 	}
-	if rebuildAfterTowerDamage {
-		g.rebuildEnemySpatialIndex()
-	}
-
-	// 3. Move enemies & collect survivors.
 	remaining := make([]*Enemy, 0, len(g.Enemies))
 	for _, e := range g.Enemies {
 		if e.Health <= 0 {
@@ -650,13 +685,10 @@ func (g *Game) UpdateGameState() {
 		path := g.Paths[pathIdx]
 
 		actualSpeed := e.Speed
-		for _, sz := range g.SlowZones {
-			if sz.Pos.Y == e.Pos.Y && sz.Pos.X == e.Pos.X {
-				actualSpeed *= 0.5
-				if g.ResearchLevels["control"] > 0 {
-					actualSpeed *= 0.85
-				}
-				break
+		if _, slowed := slowTiles[e.Pos]; slowed {
+			actualSpeed *= 0.5
+			if g.ResearchLevels["control"] > 0 {
+				actualSpeed *= 0.85
 			}
 		}
 		e.DistanceMoved += actualSpeed
@@ -754,8 +786,7 @@ func (g *Game) runTowerPhase() {
 				if target == t {
 					continue
 				}
-				dist := math.Sqrt(math.Pow(float64(t.Pos.Y-target.Pos.Y), 2) + math.Pow(float64(t.Pos.X-target.Pos.X), 2))
-				if dist <= float64(t.Range) {
+				if withinRange(t.Pos, target.Pos, t.Range) {
 					boosts[target] += 0.5
 				}
 			}
@@ -844,6 +875,16 @@ func (g *Game) applyAdaptivePressure() {
 	}
 }
 
-func distance(a, b Position) float64 {
-	return math.Sqrt(math.Pow(float64(a.Y-b.Y), 2) + math.Pow(float64(a.X-b.X), 2))
+// distanceSquared is the squared Euclidean distance between two tiles. Range
+// checks compare it against the squared radius rather than taking a square
+// root: on integer tiles the two tests select exactly the same cells, and
+// this one is a few integer multiplies instead of two math.Pow calls and a
+// math.Sqrt per tower/enemy pair, every tick.
+func distanceSquared(a, b Position) int {
+	dy, dx := a.Y-b.Y, a.X-b.X
+	return dy*dy + dx*dx
+}
+
+func withinRange(a, b Position, radius int) bool {
+	return distanceSquared(a, b) <= radius*radius
 }
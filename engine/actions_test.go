@@ -71,6 +71,37 @@ func TestPlaceSlowZone(t *testing.T) {
 	}
 }
 
+// TestSlowZoneHalvesSpeedOnlyOnItsTile checks the slow-zone lookup in the
+// movement pass: an enemy standing on a zone advances half as far as an
+// identical enemy one tile further on, which is not on any zone.
+func TestSlowZoneHalvesSpeedOnlyOnItsTile(t *testing.T) {
+	g := NewGame("test", "test")
+	g.AIEnabled = false
+	path := g.Paths[0]
+	if len(path) < 4 {
+		t.Fatalf("test setup: need a path of at least 4 tiles, got %d", len(path))
+	}
+
+	slowed := g.newEnemy(path[1].Y, path[1].X, "basic", nil)
+	slowed.PathIndex = 1
+	free := g.newEnemy(path[2].Y, path[2].X, "basic", nil)
+	free.PathIndex = 2
+	g.Enemies = []*Enemy{&slowed, &free}
+	g.WaveQueue = nil
+	g.SlowZones = []*SlowZone{{Pos: path[1]}}
+
+	g.UpdateGameState()
+
+	// A basic enemy covers one tile per tick unslowed, so the free one steps
+	// to the next tile and the slowed one is still halfway across its own.
+	if free.PathIndex != 3 || free.DistanceMoved != 0 {
+		t.Fatalf("expected the free enemy to advance one full tile, got index %d remainder %v", free.PathIndex, free.DistanceMoved)
+	}
+	if slowed.PathIndex != 1 || slowed.DistanceMoved != 0.5 {
+		t.Fatalf("expected the slowed enemy to cover half a tile, got index %d remainder %v", slowed.PathIndex, slowed.DistanceMoved)
+	}
+}
+
 func TestEnemyShield(t *testing.T) {
 	// Create a shielded enemy
 	en := NewEnemy(0, 0, "shielded", nil)
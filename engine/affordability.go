@@ -66,13 +66,18 @@ func (g *Game) affordableActionsUnfiltered(playerID, role string) []string {
 	if role == "defender" {
 		// Only advertise tower placement when a legal cell actually exists;
 		// on a saturated board "place" would be guaranteed to be rejected.
-		if len(g.validTowerCandidates(1)) > 0 {
-			for _, name := range placeableTowerTypes {
-				if cost, ok := g.towerCost(name); ok && res >= cost {
-					actions = append(actions, "place:"+name)
-				}
+		// Affordability is checked first: it is a few comparisons, while
+		// finding a legal cell walks the paths, and on the many turns a
+		// defender cannot afford any tower that walk would be wasted.
+		placeable := len(actions)
+		for _, name := range placeableTowerTypes {
+			if cost, ok := g.towerCost(name); ok && res >= cost {
+				actions = append(actions, "place:"+name)
 			}
 		}
+		if len(actions) > placeable && len(g.validTowerCandidates(1)) == 0 {
+			actions = actions[:placeable]
+		}
 		for id, tower := range g.Towers {
 			if res >= 150*(tower.Level+1) {
 				actions = append(actions, fmt.Sprintf("upgrade:%d", id))
@@ -128,10 +128,10 @@ func TestFormatAffordableActionsIncludesTowerCandidates(t *testing.T) {
 	if !strings.Contains(got, "place:basic") {
 		t.Fatalf("expected place listed, got %q", got)
 	}
-	if !strings.Contains(got, "[3 12]") || !strings.Contains(got, "[5 7]") || !strings.Contains(got, "[6 9]") {
+	if !strings.Contains(got, "include 3,12 5,7 6,9") {
 		t.Fatalf("expected first three candidate cells inline, got %q", got)
 	}
-	if strings.Contains(got, "[8 1]") {
+	if strings.Contains(got, "8,1") {
 		t.Fatalf("expected candidate list capped at three, got %q", got)
 	}
 }
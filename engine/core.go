@@ -1,11 +1,13 @@
 package engine
 
 import (
+	"context"
 	"encoding/json"
 	"errors"
 	"fmt"
-	"math"
 	"math/rand"
+	"sort"
+	"strconv"
 	"strings"
 	"time"
 )
@@ -96,7 +98,7 @@ func (t *Tower) Attack(enemies []*Enemy) []*Enemy {
 		enemy    *Enemy
 	}
 
-	var targets []Target
+	targets := make([]Target, 0, len(enemies))
 	for _, enemy := range enemies {
 		if enemy.Health <= 0 {
 			// Killed earlier this tick; the spatial index is only rebuilt
@@ -104,9 +106,11 @@ func (t *Tower) Attack(enemies []*Enemy) []*Enemy {
 			// waste shots on them (and kills would be rewarded twice).
 			continue
 		}
-		distance := math.Sqrt(math.Pow(float64(t.Pos.Y-enemy.Pos.Y), 2) + math.Pow(float64(t.Pos.X-enemy.Pos.X), 2))
-		if distance <= float64(t.Range) {
-			sortKey := distance
+		// Squared distance orders targets exactly as distance does, so the
+		// nearest-first default needs no square root.
+		d2 := distanceSquared(t.Pos, enemy.Pos)
+		if d2 <= t.Range*t.Range {
+			sortKey := float64(d2)
 			if t.Strategy == "strongest" {
 				sortKey = float64(-enemy.Health)
 			} else if t.Strategy == "fastest" {
@@ -128,23 +132,18 @@ func (t *Tower) Attack(enemies []*Enemy) []*Enemy {
 		}
 	}
 
-	var hitEnemies []*Enemy
+	// A splash tower hits up to three targets, anything else only the first;
+	// sizing the result to that up front saves the append growth per shot.
+	limit := 1
 	if t.TowerType == "splash" {
-		limit := 3
-		if len(targets) < limit {
-			limit = len(targets)
-		}
-		for i := 0; i < limit; i++ {
-			enemy := targets[i].enemy
-			damage := t.Damage
-			if enemy.Shield > 0 {
-				damage /= (enemy.Shield + 1)
-			}
-			enemy.Health -= damage
-			hitEnemies = append(hitEnemies, enemy)
-		}
-	} else {
-		enemy := targets[0].enemy
+		limit = 3
+	}
+	if len(targets) < limit {
+		limit = len(targets)
+	}
+	hitEnemies := make([]*Enemy, 0, limit)
+	for i := 0; i < limit; i++ {
+		enemy := targets[i].enemy
 		damage := t.Damage
 		if enemy.Shield > 0 {
 			damage /= (enemy.Shield + 1)
@@ -204,7 +203,7 @@ func formatAffordableActions(gameState map[string]interface{}) string {
 	if len(actions) == 1 && actions[0] == "save" {
 		return "save (nothing else is affordable this turn)"
 	}
-	line := strings.Join(actions, ", ")
+	line := strings.Join(collapseUpgradeActions(actions), ", ")
 	hasPlace := false
 	for _, action := range actions {
 		if strings.HasPrefix(action, "place:") {
@@ -218,16 +217,38 @@ func formatAffordableActions(gameState map[string]interface{}) string {
 			if len(candidates) < limit {
 				limit = len(candidates)
 			}
-			cells := make([]string, 0, limit)
-			for _, cell := range candidates[:limit] {
-				cells = append(cells, fmt.Sprintf("%v", cell))
-			}
-			line += "; valid tower cells include " + strings.Join(cells, ", ")
+			line += "; valid tower cells include " + compactPromptValue(candidates[:limit])
 		}
 	}
 	return line
 }
 
+// collapseUpgradeActions folds "upgrade:0, upgrade:1, ..." -- one entry per
+// affordable tower, so the line grew with the defence -- into a single
+// "upgrade:<tower_id>" entry where the first one stood. The action menu
+// already lists the affordable tower ids once.
+func collapseUpgradeActions(actions []string) []string {
+	upgrades := 0
+	for _, action := range actions {
+		if strings.HasPrefix(action, "upgrade:") {
+			upgrades++
+		}
+	}
+	if upgrades < 2 {
+		return actions
+	}
+	out := make([]string, 0, len(actions)-upgrades+1)
+	for _, action := range actions {
+		if !strings.HasPrefix(action, "upgrade:") {
+			out = append(out, action)
+		} else if upgrades > 0 {
+			out = append(out, "upgrade:<tower_id>")
+			upgrades = 0
+		}
+	}
+	return out
+}
+
 // promptCost reads a per-type cost map out of the game state, falling back to
 // the default balance config so prompts never render zeros — and never go
 // stale, since the fallback is derived rather than hardcoded.
@@ -263,46 +284,94 @@ func rejectionFeedbackLine(gameState map[string]interface{}) string {
 	return fmt.Sprintf("STOP: your last %d actions were ALL REJECTED (%s). You MUST choose a different action or position this turn.\n", streak, reason)
 }
 
+// rolePrompt is a turn's prompt split where it stops being the same from one
+// turn to the next. System holds everything fixed for the whole match -- the
+// role, the objective, the unit reference and the standing advice -- and User
+// holds this turn's state. Providers send them in that order (as separate
+// system and user messages only where params.system_message asks for it; see
+// chatMessages), so every request in a match opens
+// with the same several hundred tokens and the provider's prefix cache can
+// serve them instead of re-reading them each turn. Anything that varies
+// turn to turn must go in User: a single changing byte in System would end
+// the shared prefix there.
+type rolePrompt struct {
+	Role   string // "defender" or "attacker"; selects the structured-output schema
+	System string
+	User   string
+}
+
+// joined renders the prompt as one string, for callers with a single text
+// slot (and for the decision cache key, which must cover both halves).
+func (p rolePrompt) joined() string {
+	return p.System + "\n\n" + p.User
+}
+
+// The static text is package-level constants, so building a prompt is a
+// handful of appends rather than fmt re-parsing a 3KB format string (and its
+// %% escapes) on every turn.
+const defenderPromptIntro = "You are the Defender in a Tower Defense Battleground. Goal: Stop enemies from reaching the end.\n"
+
+const promptActionSchemaLine = "Legal action schema: exactly one JSON object with keys action, reason, taunt and action-specific fields.\n"
+
+const defenderPromptObjective = "Current objective: maximize survival and defend lives while keeping future economy viable.\n" +
+	promptActionSchemaLine
+
+const defenderPromptReference = "Tower stats (damage / range / cooldown / cost):\n" +
+	"- basic  34 / 5 / 2 / 100. Your workhorse: cheap and fires often.\n" +
+	"- sniper 50 / 12 / 15 / 250. Long reach and hard hitting, but fires once every 15 ticks.\n" +
+	"- splash 10 / 3 / 3 / 200. Low damage, hits groups.\n" +
+	"- buffer 0 / 2 / n/a / 300. Deals no damage at all.\n\n" +
+	"Strategic Advice:\n" +
+	"- A buffer tower adds +50% damage to every OTHER tower within 2 tiles, and the bonus\n" +
+	"  stacks if several buffers overlap. It never attacks, so it is only worth its 300 cost\n" +
+	"  when it sits beside two or more damage towers. Placing buffers next to each other\n" +
+	"  achieves nothing, because a buffer has no damage to boost.\n" +
+	"- Shielded enemies (S) carry shield 2, which divides ALL incoming damage by 3: a sniper\n" +
+	"  hit drops from 50 to 16. Volume of fire beats single big hits against them.\n" +
+	"- Healer enemies (H) restore health to nearby enemies, so kill them first when both are\n" +
+	"  in range.\n" +
+	"- Enemy health for reference: basic 100, fast 50, tank 300, shielded 150, healer 80.\n" +
+	"- Invest early if you can afford to, but don't let your lives drop too low.\n" +
+	"- Only choose an action listed as affordable in this turn's message. Anything else is\n" +
+	"  rejected and you lose the turn.\n" +
+	"- If last_rejected_reason is non-empty, change the action AND the position, not just one.\n" +
+	"- You may include a taunt for your opponent."
+
+const promptResponseLine = "Respond with exactly one JSON object only."
+
+// writePromptTurn writes the per-turn half shared by both roles: resources,
+// the affordable-action line, any rejection warning, the action menu and the
+// state summary, ending on the response instruction.
+func writePromptTurn(b *strings.Builder, gameState map[string]interface{}, wave int, paths interface{}, menu string) {
+	fmt.Fprintf(b, "Current Resources: %s, Base Income: %s, Wave: %d, Paths: %v\n",
+		compactPromptValue(gameState["resources"]), compactPromptValue(gameState["income"]), wave, paths)
+	b.WriteString("You can currently afford ONLY these actions: ")
+	b.WriteString(formatAffordableActions(gameState))
+	b.WriteString("\n")
+	b.WriteString(rejectionFeedbackLine(gameState))
+	b.WriteString("Your available tools this turn:\n")
+	b.WriteString(menu)
+	b.WriteString("\nState summary:\n")
+	b.WriteString(summarizePromptState(gameState))
+	b.WriteString("\n\n")
+	b.WriteString(promptResponseLine)
+}
+
 func (h *OpenAIHandler) createTowerPrompt(gameState map[string]interface{}) string {
+	return h.towerPrompt(gameState).joined()
+}
+
+func (h *OpenAIHandler) towerPrompt(gameState map[string]interface{}) rolePrompt {
 	pathsCount := gameState["paths_count"].(int)
 	wave := gameState["wave"].(int)
-	stateSummary := summarizePromptState(gameState)
-	prompt := fmt.Sprintf(
-		"You are the Defender in a Tower Defense Battleground. Goal: Stop enemies from reaching the end.\n"+
-			"Current Resources: %v, Base Income: %v, Wave: %d, Paths: %d\n"+
-			"You can currently afford ONLY these actions: %s\n"+
-			"%s\n"+
-			"Current objective: maximize survival and defend lives while keeping future economy viable.\n"+
-			"Legal action schema: exactly one JSON object with keys action, reason, taunt and action-specific fields.\n"+
-			"Your available tools this turn:\n%s\n"+
-			"State summary:\n%s\n\n"+
-			"Tower stats (damage / range / cooldown / cost):\n"+
-			"- basic  34 / 5 / 2 / 100. Your workhorse: cheap and fires often.\n"+
-			"- sniper 50 / 12 / 15 / 250. Long reach and hard hitting, but fires once every 15 ticks.\n"+
-			"- splash 10 / 3 / 3 / 200. Low damage, hits groups.\n"+
-			"- buffer 0 / 2 / n/a / 300. Deals no damage at all.\n\n"+
-			"Strategic Advice:\n"+
-			"- A buffer tower adds +50%% damage to every OTHER tower within 2 tiles, and the bonus\n"+
-			"  stacks if several buffers overlap. It never attacks, so it is only worth its 300 cost\n"+
-			"  when it sits beside two or more damage towers. Placing buffers next to each other\n"+
-			"  achieves nothing, because a buffer has no damage to boost.\n"+
-			"- Shielded enemies (S) carry shield 2, which divides ALL incoming damage by 3: a sniper\n"+
-			"  hit drops from 50 to 16. Volume of fire beats single big hits against them.\n"+
-			"- Healer enemies (H) restore health to nearby enemies, so kill them first when both are\n"+
-			"  in range.\n"+
-			"- Enemy health for reference: basic 100, fast 50, tank 300, shielded 150, healer 80.\n"+
-			"- Invest early if you can afford to, but don't let your lives drop too low.\n"+
-			"- Only choose an action listed as affordable above. Anything else is rejected and you\n"+
-			"  lose the turn.\n"+
-			"- If last_rejected_reason is non-empty, change the action AND the position, not just one.\n"+
-			"- You may include a taunt for your opponent.\n\n"+
-			"Respond with exactly one JSON object only.",
-		gameState["resources"], gameState["income"], wave, pathsCount,
-		formatAffordableActions(gameState), rejectionFeedbackLine(gameState),
-		buildDefenderActionMenu(gameState),
-		stateSummary,
-	)
-	return prompt
+	var user strings.Builder
+	user.Grow(2048)
+	writePromptTurn(&user, gameState, wave, pathsCount, buildDefenderActionMenu(gameState))
+	return rolePrompt{
+		Role:   "defender",
+		System: defenderPromptIntro + defenderPromptObjective + "\n" + defenderPromptReference + "\n\n" + promptStateLegend,
+		User:   user.String(),
+	}
 }
 
 func (h *OpenAIHandler) parseTowerResponse(response string) (map[string]interface{}, error) {
@@ -337,46 +406,53 @@ func (h *OpenAIHandler) parseTowerResponse(response string) (map[string]interfac
 // GeminiHandler is stateless for the same reason as OpenAIHandler above.
 type GeminiHandler struct{}
 
+const attackerPromptIntro = "You are the Attacker in a Tower Defense Battleground. Goal: Overwhelm the Defender.\n"
+
+const attackerPromptObjective = "Current objective: convert resources into breaches quickly while maintaining wave pressure.\n" +
+	promptActionSchemaLine
+
+// The attacker reference is split around the path count in the wave advice.
+// It is still part of the static half: a match never changes its paths.
+const attackerPromptReferenceHead = "Unit stats (health / speed / spawn cost):\n" +
+	"- basic    100 / 1.0 / 20. Cheapest body.\n" +
+	"- fast      50 / 2.0 / 30. Fragile, but crosses the map in half the time.\n" +
+	"- tank     300 / 0.5 / 50. Six times a basic's health, slowest mover.\n" +
+	"- shielded 150 / 0.8 / 40. Shield 2 divides all incoming damage by 3.\n" +
+	"- healer    80 / 1.0 / 30. Restores health to nearby enemies.\n\n" +
+	"Strategic Advice:\n" +
+	"- Shielded units take one third damage from every tower, not just some of them. They\n" +
+	"  are the efficient way through concentrated defences: 150 health behind shield 2\n" +
+	"  absorbs roughly 450 raw damage for 40 resources.\n" +
+	"- A healer behind tanks keeps the tanks alive far longer than either unit alone. Sent\n" +
+	"  by itself a healer has nothing to heal and dies quickly.\n" +
+	"- Fast units are for slipping past long-cooldown towers such as snipers, which fire\n" +
+	"  once every 15 ticks and cannot re-target quickly.\n" +
+	"- Sending a wave splits enemies across all "
+
+const attackerPromptReferenceTail = " paths, so it thins any single defence\n" +
+	"  but commits your resources at once.\n" +
+	"- Only choose an action listed as affordable in this turn's message. Anything else is\n" +
+	"  rejected and you lose the turn, which is the most common way to fall behind.\n" +
+	"- If last_rejected_reason is non-empty, pick a genuinely different action, not the same\n" +
+	"  one with a different unit.\n" +
+	"- You may include a taunt for your opponent."
+
 func (h *GeminiHandler) createEnemyPrompt(gameState map[string]interface{}) string {
+	return h.enemyPrompt(gameState).joined()
+}
+
+func (h *GeminiHandler) enemyPrompt(gameState map[string]interface{}) rolePrompt {
 	wave := gameState["wave"].(int)
-	stateSummary := summarizePromptState(gameState)
-	prompt := fmt.Sprintf(
-		"You are the Attacker in a Tower Defense Battleground. Goal: Overwhelm the Defender.\n"+
-			"Current Resources: %v, Base Income: %v, Wave: %d, Paths: %d\n"+
-			"You can currently afford ONLY these actions: %s\n"+
-			"%s\n"+
-			"Current objective: convert resources into breaches quickly while maintaining wave pressure.\n"+
-			"Legal action schema: exactly one JSON object with keys action, reason, taunt and action-specific fields.\n"+
-			"Your available tools this turn:\n%s\n"+
-			"State summary:\n%s\n\n"+
-			"Unit stats (health / speed / spawn cost):\n"+
-			"- basic    100 / 1.0 / 20. Cheapest body.\n"+
-			"- fast      50 / 2.0 / 30. Fragile, but crosses the map in half the time.\n"+
-			"- tank     300 / 0.5 / 50. Six times a basic's health, slowest mover.\n"+
-			"- shielded 150 / 0.8 / 40. Shield 2 divides all incoming damage by 3.\n"+
-			"- healer    80 / 1.0 / 30. Restores health to nearby enemies.\n\n"+
-			"Strategic Advice:\n"+
-			"- Shielded units take one third damage from every tower, not just some of them. They\n"+
-			"  are the efficient way through concentrated defences: 150 health behind shield 2\n"+
-			"  absorbs roughly 450 raw damage for 40 resources.\n"+
-			"- A healer behind tanks keeps the tanks alive far longer than either unit alone. Sent\n"+
-			"  by itself a healer has nothing to heal and dies quickly.\n"+
-			"- Fast units are for slipping past long-cooldown towers such as snipers, which fire\n"+
-			"  once every 15 ticks and cannot re-target quickly.\n"+
-			"- Sending a wave splits enemies across all %d paths, so it thins any single defence\n"+
-			"  but commits your resources at once.\n"+
-			"- Only choose an action listed as affordable above. Anything else is rejected and you\n"+
-			"  lose the turn, which is the most common way to fall behind.\n"+
-			"- If last_rejected_reason is non-empty, pick a genuinely different action, not the same\n"+
-			"  one with a different unit.\n"+
-			"- You may include a taunt for your opponent.\n\n"+
-			"Respond with exactly one JSON object only.",
-		gameState["resources"], gameState["income"], wave, gameState["paths_count"],
-		formatAffordableActions(gameState), rejectionFeedbackLine(gameState),
-		buildAttackerActionMenu(gameState),
-		stateSummary, gameState["paths_count"],
-	)
-	return prompt
+	var user strings.Builder
+	user.Grow(2048)
+	writePromptTurn(&user, gameState, wave, gameState["paths_count"], buildAttackerActionMenu(gameState))
+	return rolePrompt{
+		Role: "attacker",
+		System: attackerPromptIntro + attackerPromptObjective + "\n" +
+			attackerPromptReferenceHead + fmt.Sprintf("%d", gameState["paths_count"]) + attackerPromptReferenceTail +
+			"\n\n" + promptStateLegend,
+		User: user.String(),
+	}
 }
 
 func (h *GeminiHandler) parseEnemyResponse(response string) (map[string]interface{}, error) {
@@ -424,7 +500,7 @@ type Game struct {
 	MapType         string
 	Paths           [][]Position
 	PathTileSet     map[string]struct{}
-	EnemyTileIndex  map[string][]*Enemy
+	EnemyTileIndex  map[Position][]*Enemy
 	Towers          []*Tower
 	Enemies         []*Enemy
 	SlowZones       []*SlowZone
@@ -533,6 +609,7 @@ type Game struct {
 	WaveSummaries       map[int]*WaveSummary
 	ProviderErrors      map[string]int
 	ProviderCalls       map[string]int
+	ProviderCacheHits   map[string]int
 	ProviderLatencyMS   map[string]int64
 	ProviderTokenUsage  map[string]int
 	ProviderCostMicros  map[string]int64
@@ -546,6 +623,11 @@ type Game struct {
 	AutoWaveMinResource int
 	AutoDefendMinStreak int
 	AssistsDisabled     bool
+	// LogsDisabled makes logf return before formatting anything. Runners
+	// that never display g.Logs -- scripted duels, tournament matches -- set
+	// it, so the decision, rejection and status lines of every turn are not
+	// Sprintf'd only to be trimmed off the end of a buffer nobody reads.
+	LogsDisabled bool
 	// SkipForcedSaveTurns mirrors ArenaRuleset.SkipForcedSaveTurns; see there
 	// for what it does and why it defaults to false. Set via ApplyRuleset.
 	SkipForcedSaveTurns bool
@@ -567,7 +649,15 @@ type Game struct {
 	Player1            string
 	Player2            string
 	pendingTurnResults chan turnResult
-	mapInitRecorded    bool
+	// turnCtx scopes every provider request the turn worker makes; it is
+	// cancelled by CancelPendingTurns once the match is over. See
+	// ContextDecisionProvider.
+	turnCtx         context.Context
+	cancelTurns     context.CancelFunc
+	mapInitRecorded bool
+	// towerGrid maps each tower's tile to the tower on it, so placement
+	// checks are one lookup instead of a scan of g.Towers. See towerAt.
+	towerGrid map[Position]*Tower
 	// ReplayTruncated is true once trimReplayEvents has discarded any real
 	// event to respect MaxReplayEvents. See replay.go.
 	ReplayTruncated   bool
@@ -633,9 +723,10 @@ func NewGameFromResolvedConfig(resolved ResolvedMatchConfig) *Game {
 		GameSpeed:      0.1, AIDecisionInterval: map[string]int{p1: 2, p2: 2},
 		LastAIDecision: map[string]time.Time{p1: time.Now(), p2: time.Now()},
 		CurrentTurn:    p1, LastActionTime: time.Now(), StartedAt: time.Now(), MaxResources: 800, MaxWaves: 30, TurnTimeout: 45 * time.Second,
-		PauseBetweenTurns: true, PauseDuration: 1 * time.Second, lastStatePrintTime: time.Now(), rng: rng, Logs: make([]string, 0), MaxLogs: 250, MaxWaveQueue: 200, ReplayEvents: make([]ReplayEvent, 0), MaxReplayEvents: 10000, ActionCounters: map[string]int{}, RejectedActions: map[string]int{}, DecisionSources: map[string]int{}, EngineAssists: map[string]int{}, AuthoredSaves: map[string]int{p1: 0, p2: 0}, DecisionsResolved: map[string]int{p1: 0, p2: 0}, LeakWindow: make([]bool, 0, LeakWindowSize), WaveSummaries: map[int]*WaveSummary{}, ProviderErrors: map[string]int{}, ProviderCalls: map[string]int{}, ProviderLatencyMS: map[string]int64{}, ProviderTokenUsage: map[string]int{}, ProviderCostMicros: map[string]int64{}, TokenPricing: map[string]tokenPricing{p1: pricingFromConfig(resolved.Player1), p2: pricingFromConfig(resolved.Player2)}, LastActionStatus: map[string]string{p1: "none", p2: "none"}, LastRejectedReason: map[string]string{p1: "", p2: ""}, NoopStreak: map[string]int{p1: 0, p2: 0}, RejectionStreak: map[string]int{p1: 0, p2: 0}, LastRejectedAction: map[string]string{p1: "", p2: ""}, AutoWaveMinResource: 260, AutoDefendMinStreak: 2, FogOfWar: true, DefenderVisionRange: 8, BaseVisionRange: 6, ResearchLevels: map[string]int{"economy": 0, "range": 0, "control": 0}, AbilityCooldowns: map[string]int{"surge": 0, "shield_burst": 0, "reinforce_wave": 0},
-		PathTileSet: make(map[string]struct{}), EnemyTileIndex: make(map[string][]*Enemy), ObstacleTileSet: make(map[string]struct{}), pendingTurnResults: make(chan turnResult, 8),
+		PauseBetweenTurns: true, PauseDuration: 1 * time.Second, lastStatePrintTime: time.Now(), rng: rng, Logs: make([]string, 0), MaxLogs: 250, MaxWaveQueue: 200, ReplayEvents: make([]ReplayEvent, 0), MaxReplayEvents: 10000, ActionCounters: map[string]int{}, RejectedActions: map[string]int{}, DecisionSources: map[string]int{}, EngineAssists: map[string]int{}, AuthoredSaves: map[string]int{p1: 0, p2: 0}, DecisionsResolved: map[string]int{p1: 0, p2: 0}, LeakWindow: make([]bool, 0, LeakWindowSize), WaveSummaries: map[int]*WaveSummary{}, ProviderErrors: map[string]int{}, ProviderCalls: map[string]int{}, ProviderCacheHits: map[string]int{}, ProviderLatencyMS: map[string]int64{}, ProviderTokenUsage: map[string]int{}, ProviderCostMicros: map[string]int64{}, TokenPricing: map[string]tokenPricing{p1: pricingFromConfig(resolved.Player1), p2: pricingFromConfig(resolved.Player2)}, LastActionStatus: map[string]string{p1: "none", p2: "none"}, LastRejectedReason: map[string]string{p1: "", p2: ""}, NoopStreak: map[string]int{p1: 0, p2: 0}, RejectionStreak: map[string]int{p1: 0, p2: 0}, LastRejectedAction: map[string]string{p1: "", p2: ""}, AutoWaveMinResource: 260, AutoDefendMinStreak: 2, FogOfWar: true, DefenderVisionRange: 8, BaseVisionRange: 6, ResearchLevels: map[string]int{"economy": 0, "range": 0, "control": 0}, AbilityCooldowns: map[string]int{"surge": 0, "shield_burst": 0, "reinforce_wave": 0},
+		PathTileSet: make(map[string]struct{}), EnemyTileIndex: make(map[Position][]*Enemy), ObstacleTileSet: make(map[string]struct{}), pendingTurnResults: make(chan turnResult, 8),
 	}
+	game.turnCtx, game.cancelTurns = context.WithCancel(context.Background())
 	game.Paths = game.generatePaths()
 	game.rebuildPathTileSet()
 	game.generateObstacles()
@@ -799,8 +890,18 @@ func (g *Game) rebuildPathTileSet() {
 	}
 }
 
+// tileKey keys the path and obstacle tile sets. Range checks no longer use it
+// -- the enemy index and towerGrid are keyed by Position -- but placement
+// checks still do: validTowerCandidates runs canPlaceTowerAt on the four
+// neighbours of every path tile, several keys per cell, every turn. So it
+// builds the "y,x" key with strconv rather than fmt: same string, without
+// fmt's interface boxing and format parsing on each call.
 func tileKey(y, x int) string {
-	return fmt.Sprintf("%d,%d", y, x)
+	buf := make([]byte, 0, 8)
+	buf = strconv.AppendInt(buf, int64(y), 10)
+	buf = append(buf, ',')
+	buf = strconv.AppendInt(buf, int64(x), 10)
+	return string(buf)
 }
 
 func (g *Game) HandleAIDecisions() {
@@ -845,8 +946,9 @@ func (g *Game) HandleAIDecisions() {
 	if !g.isDecisionIntervalElapsed(player, currentTime) {
 		return
 	}
+	actions := g.affordableActions(player, role)
 	if g.SkipForcedSaveTurns {
-		if actions := g.affordableActions(player, role); len(actions) == 1 && actions[0] == "save" {
+		if len(actions) == 1 && actions[0] == "save" {
 			// Nothing to decide: "save" is the only legal action, so a real
 			// provider call could only ever come back as "save" (scripted
 			// providers already take exactly this branch off the same
@@ -863,7 +965,7 @@ func (g *Game) HandleAIDecisions() {
 			return
 		}
 	}
-	gameState := g.getPlayerGameState(player, role)
+	gameState := g.playerGameState(player, role, actions)
 	g.handlePlayerTurn(player, role, gameState)
 }
 
@@ -922,7 +1024,14 @@ func (g *Game) handlePlayerTurn(playerID, role string, gameState map[string]inte
 		}
 
 		var decision map[string]interface{}
-		if role == "defender" {
+		if ctxProvider, ok := provider.(ContextDecisionProvider); ok {
+			ctx := g.turnContext()
+			if role == "defender" {
+				decision, err = ctxProvider.GetTowerDecisionContext(ctx, gameState)
+			} else {
+				decision, err = ctxProvider.GetEnemyDecisionContext(ctx, gameState)
+			}
+		} else if role == "defender" {
 			decision, err = provider.GetTowerDecision(gameState)
 		} else {
 			decision, err = provider.GetEnemyDecision(gameState)
@@ -932,6 +1041,28 @@ func (g *Game) handlePlayerTurn(playerID, role string, gameState map[string]inte
 	}()
 }
 
+// turnContext returns the context provider requests run under. A Game built
+// as a struct literal (tests, NewTower's throwaway) has none, and gets one
+// that is never cancelled.
+func (g *Game) turnContext() context.Context {
+	if g.turnCtx == nil {
+		return context.Background()
+	}
+	return g.turnCtx
+}
+
+// CancelPendingTurns abandons any provider request still in flight. The
+// worker goroutine still reports back through pendingTurnResults -- with the
+// cancellation as its error -- so AIThinking is cleared the usual way; it
+// just does so now instead of after the HTTP timeout. Safe to call more
+// than once.
+func (g *Game) CancelPendingTurns() {
+	if g == nil || g.cancelTurns == nil {
+		return
+	}
+	g.cancelTurns()
+}
+
 func (g *Game) applyDecision(playerID, role string, decision map[string]interface{}) {
 	// Provenance must be read off the raw decision BEFORE normalizeDecision
 	// runs: normalizeDecision builds a brand new map, so a tag stamped by a
@@ -1196,6 +1327,9 @@ func classifyActionOutcome(outcome string) string {
 }
 
 func (g *Game) logf(format string, a ...interface{}) {
+	if g.LogsDisabled {
+		return
+	}
 	msg := fmt.Sprintf(format, a...)
 	g.Logs = append(g.Logs, msg)
 	if g.MaxLogs > 0 && len(g.Logs) > g.MaxLogs {
@@ -1244,8 +1378,15 @@ func (g *Game) processPendingTurnResults() bool {
 			processed = true
 			g.AIThinking[result.playerID] = false
 			g.LastAIDecision[result.playerID] = time.Now()
-			g.ProviderCalls[result.playerID]++
-			g.ProviderLatencyMS[result.playerID] += result.latency.Milliseconds()
+			// A turn answered from the decision cache made no request: it is
+			// counted on its own so it neither inflates ProviderCalls nor
+			// pulls the average latency towards zero.
+			if takeCacheHit(result.decision) {
+				g.ProviderCacheHits[result.playerID]++
+			} else {
+				g.ProviderCalls[result.playerID]++
+				g.ProviderLatencyMS[result.playerID] += result.latency.Milliseconds()
+			}
 			if usage, ok := takeTokenUsage(result.decision); ok {
 				g.ProviderTokenUsage[result.playerID] += usage.Total
 				if micros := g.tokenCostMicros(result.playerID, usage); micros > 0 {
@@ -1469,6 +1610,28 @@ func takeTokenUsage(decision map[string]interface{}) (tokenUsage, bool) {
 	return u, ok
 }
 
+// cacheHitKey is a reserved decision-map key, carried the same way as
+// tokenUsageKey, marking a decision whose response came from the decision
+// cache rather than a provider request. It is stripped before a decision is
+// applied.
+const cacheHitKey = "_cache_hit"
+
+func markCacheHit(decision map[string]interface{}) {
+	if decision != nil {
+		decision[cacheHitKey] = true
+	}
+}
+
+// takeCacheHit removes the cache-hit mark and reports whether it was set.
+func takeCacheHit(decision map[string]interface{}) bool {
+	if decision == nil {
+		return false
+	}
+	_, ok := decision[cacheHitKey]
+	delete(decision, cacheHitKey)
+	return ok
+}
+
 // extractOpenAIUsage reads the `usage` object from an OpenAI-compatible
 // chat completion response.
 func extractOpenAIUsage(result map[string]interface{}) (tokenUsage, bool) {
@@ -1546,37 +1709,122 @@ func summarizePromptState(gameState map[string]interface{}) string {
 	lines := make([]string, 0, len(keys)+2)
 	for _, k := range keys {
 		if v, ok := gameState[k]; ok {
-			lines = append(lines, fmt.Sprintf("- %s: %v", k, v))
+			lines = append(lines, "- "+k+": "+compactPromptValue(v))
 		}
 	}
 	if towers, ok := gameState["towers"].([]interface{}); ok {
-		lines = append(lines, fmt.Sprintf("- towers_count: %d", len(towers)))
+		lines = append(lines, "- towers_count: "+strconv.Itoa(len(towers)))
 	}
 	if enemies, ok := gameState["enemies"].([]interface{}); ok {
-		lines = append(lines, fmt.Sprintf("- enemies_count: %d", len(enemies)))
-	}
-	if candidates, ok := gameState["valid_tower_candidates"]; ok {
-		lines = append(lines, fmt.Sprintf("- valid_tower_candidates: %v", candidates))
+		lines = append(lines, "- enemies_count: "+strconv.Itoa(len(enemies)))
 	}
-	if pressure, ok := gameState["pressure"]; ok {
-		lines = append(lines, fmt.Sprintf("- pressure: %v", pressure))
-	}
-	if visibility, ok := gameState["visibility"]; ok {
-		lines = append(lines, fmt.Sprintf("- visibility: %v", visibility))
+	for _, k := range []string{"valid_tower_candidates", "pressure", "visibility", "research"} {
+		if v, ok := gameState[k]; ok {
+			lines = append(lines, "- "+k+": "+compactPromptValue(v))
+		}
 	}
-	if research, ok := gameState["research"]; ok {
-		lines = append(lines, fmt.Sprintf("- research: %v", research))
+	if abilities, ok := gameState["attacker_abilities"].([]interface{}); ok {
+		lines = append(lines, "- attacker_abilities: "+compactAbilityCooldowns(abilities))
 	}
-	if abilities, ok := gameState["attacker_abilities"]; ok {
-		lines = append(lines, fmt.Sprintf("- attacker_abilities: %v", abilities))
+	// last_rejected_reason has nothing to say on most turns, and the static
+	// advice keys off it being non-empty -- so a map with no reasons left is
+	// left out entirely rather than rendered as some placeholder.
+	for _, k := range []string{"director", "last_rejected_reason"} {
+		if v, ok := gameState[k]; ok {
+			if rendered := compactPromptValue(v); rendered != "" {
+				lines = append(lines, "- "+k+": "+rendered)
+			}
+		}
 	}
-	if director, ok := gameState["director"]; ok {
-		lines = append(lines, fmt.Sprintf("- director: %v", director))
+	return strings.Join(lines, "\n")
+}
+
+// promptStateLegend explains the compact notation summarizePromptState and
+// the status line use. It lives in the static half of the prompt (see
+// rolePrompt), so it is paid for once per match by the prefix cache rather
+// than on every turn. The ability descriptions come from
+// availableAttackerAbilities, so a change there cannot leave them stale.
+var promptStateLegend = buildPromptStateLegend()
+
+func buildPromptStateLegend() string {
+	abilities := availableAttackerAbilities()
+	described := make([]string, 0, len(abilities))
+	for _, ability := range abilities {
+		described = append(described, ability.Name+": "+ability.Description)
+	}
+	return "State notation: maps are written key=value separated by spaces, cells are y,x,\n" +
+		"and attacker_abilities gives each ability's remaining cooldown in ticks (0 = ready).\n" +
+		"Abilities: " + strings.Join(described, "; ") + "."
+}
+
+// compactPromptValue renders a state value for the prompt in the notation
+// promptStateLegend describes. fmt's %v spends tokens on Go syntax the model
+// has no use for -- "map[p1:1950 p2:690]", "[[3 0] [5 0]]" -- so maps become
+// sorted key=value pairs and cell lists become y,x pairs. Empty string values
+// are dropped: last_rejected_reason in particular is empty for both players
+// on almost every turn, and a map with nothing left renders as "". Anything
+// else falls back to %v.
+func compactPromptValue(v interface{}) string {
+	switch val := v.(type) {
+	case map[string]int:
+		pairs := make([]string, 0, len(val))
+		for k, n := range val {
+			pairs = append(pairs, k+"="+strconv.Itoa(n))
+		}
+		return joinSortedPairs(pairs)
+	case map[string]string:
+		pairs := make([]string, 0, len(val))
+		for k, str := range val {
+			if str != "" {
+				pairs = append(pairs, k+"="+str)
+			}
+		}
+		return joinSortedPairs(pairs)
+	case map[string]interface{}:
+		pairs := make([]string, 0, len(val))
+		for k, item := range val {
+			if str, ok := item.(string); ok && str == "" {
+				continue
+			}
+			pairs = append(pairs, k+"="+fmt.Sprint(item))
+		}
+		return joinSortedPairs(pairs)
+	case [][]int:
+		cells := make([]string, 0, len(val))
+		for _, cell := range val {
+			if len(cell) == 2 {
+				cells = append(cells, strconv.Itoa(cell[0])+","+strconv.Itoa(cell[1]))
+			} else {
+				cells = append(cells, fmt.Sprint(cell))
+			}
+		}
+		return strings.Join(cells, " ")
+	default:
+		return fmt.Sprint(v)
 	}
-	if rejected, ok := gameState["last_rejected_reason"]; ok {
-		lines = append(lines, fmt.Sprintf("- last_rejected_reason: %v", rejected))
+}
+
+func joinSortedPairs(pairs []string) string {
+	sort.Strings(pairs)
+	return strings.Join(pairs, " ")
+}
+
+// compactAbilityCooldowns renders attacker_abilities as name=current_cooldown.
+// Each ability's description, cost and base cooldown never change within a
+// match; the description is in promptStateLegend and the attacker's action
+// menu already lists cost/cooldown for the abilities it can afford.
+func compactAbilityCooldowns(abilities []interface{}) string {
+	pairs := make([]string, 0, len(abilities))
+	for _, raw := range abilities {
+		ability, ok := raw.(map[string]interface{})
+		if !ok {
+			continue
+		}
+		name, _ := ability["name"].(string)
+		cd, _ := toIntFromAny(ability["current_cooldown"])
+		pairs = append(pairs, name+"="+strconv.Itoa(cd))
 	}
-	return strings.Join(lines, "\n")
+	return strings.Join(pairs, " ")
 }
 
 func (g *Game) TotalProviderErrorsForPlayer(playerID string) int {
@@ -0,0 +1,104 @@
+package engine
+
+import (
+	"container/list"
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"sync"
+)
+
+// decisionCache maps a digest of everything a live provider sends -- the
+// endpoint, model, sampling parameters and the rendered prompt -- to the raw
+// text the model answered with. The prompt is already a canonical rendering
+// of the state the model is shown (summarizePromptState, the action menu,
+// the rejection feedback), so two turns that would send byte-identical
+// requests share an entry, and two that differ in anything the model can
+// see never do.
+//
+// It stores the raw response, not the parsed decision: applyDecision takes
+// keys off the decision map it is handed, so every hit is re-parsed into a
+// fresh map rather than sharing one across turns.
+//
+// A single cache is shared by every provider in the process
+// (sharedDecisionCache), because the hits worth having are across matches:
+// a tournament replaying a seed with the same matchup opens with the same
+// board and asks the same first questions. Each provider passes its own
+// capacity on put, so the cache never holds more than the largest capacity
+// any caller asked for.
+type decisionCache struct {
+	mu      sync.Mutex
+	order   *list.List
+	entries map[string]*list.Element
+}
+
+type decisionCacheEntry struct {
+	key     string
+	content string
+}
+
+var sharedDecisionCache = newDecisionCache()
+
+func newDecisionCache() *decisionCache {
+	return &decisionCache{order: list.New(), entries: map[string]*list.Element{}}
+}
+
+func (c *decisionCache) get(key string) (string, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	elem, ok := c.entries[key]
+	if !ok {
+		return "", false
+	}
+	c.order.MoveToFront(elem)
+	return elem.Value.(*decisionCacheEntry).content, true
+}
+
+func (c *decisionCache) put(key, content string, capacity int) {
+	if capacity <= 0 {
+		return
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if elem, ok := c.entries[key]; ok {
+		elem.Value.(*decisionCacheEntry).content = content
+		c.order.MoveToFront(elem)
+	} else {
+		c.entries[key] = c.order.PushFront(&decisionCacheEntry{key: key, content: content})
+	}
+	for c.order.Len() > capacity {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*decisionCacheEntry).key)
+	}
+}
+
+// decisionCacheCapacity is how many responses a provider may keep in the
+// shared cache: params.cache_size, but only when sampling is deterministic.
+// At any temperature above zero the same prompt is supposed to be able to
+// produce a different answer, and replaying the first one would quietly turn
+// a sampled opponent into a fixed one -- so the cache stays off there no
+// matter what cache_size says.
+func decisionCacheCapacity(config ResolvedPlayerModelConfig) int {
+	size := int(config.Params["cache_size"])
+	if size <= 0 || resolvedTemperature(config.Params) != 0 {
+		return 0
+	}
+	return size
+}
+
+// decisionCacheKey digests every request input that can change the answer.
+// The API key and headers are deliberately not part of it: they select who
+// pays, not what the model says.
+func decisionCacheKey(config ResolvedPlayerModelConfig, prompt string) string {
+	topP, hasTopP := samplingTopP(config.Params)
+	seed, hasSeed := samplingSeed(config.Params)
+	h := sha256.New()
+	fmt.Fprintf(h, "%s\x00%s\x00%s\x00%g\x00%d\x00%t\x00%t:%g\x00%t:%d\x00%t\x00",
+		config.Provider, config.Model, config.BaseURL,
+		resolvedTemperature(config.Params), completionTokenBudget(config.Params),
+		structuredOutputEnabled(config), hasTopP, topP, hasSeed, seed,
+		systemMessageEnabled(config))
+	h.Write([]byte(prompt))
+	return hex.EncodeToString(h.Sum(nil))
+}
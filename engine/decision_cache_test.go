@@ -0,0 +1,141 @@
+package engine
+
+import (
+	"io"
+	"net/http"
+	"strings"
+	"testing"
+	"time"
+)
+
+func TestDecisionCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	c := newDecisionCache()
+	c.put("a", "A", 2)
+	c.put("b", "B", 2)
+	if _, ok := c.get("a"); !ok {
+		t.Fatalf("expected a to be cached")
+	}
+	c.put("c", "C", 2)
+	if _, ok := c.get("b"); ok {
+		t.Fatalf("expected b, the least recently used entry, to be evicted")
+	}
+	if got, ok := c.get("a"); !ok || got != "A" {
+		t.Fatalf("expected a to survive eviction, got %q ok=%v", got, ok)
+	}
+}
+
+func TestDecisionCacheCapacityRequiresZeroTemperature(t *testing.T) {
+	cfg := ResolvedPlayerModelConfig{PlayerModelConfig: PlayerModelConfig{
+		Params: map[string]float64{"cache_size": 64},
+	}}
+	if got := decisionCacheCapacity(cfg); got != 0 {
+		t.Fatalf("expected caching off at the default temperature, got capacity %d", got)
+	}
+	cfg.Params["temperature"] = 0
+	if got := decisionCacheCapacity(cfg); got != 64 {
+		t.Fatalf("expected capacity 64 at temperature 0, got %d", got)
+	}
+}
+
+// TestDecisionCacheKeyCoversSamplingParams checks that top_p and seed reach
+// the cache key, and that an explicit seed of 0 is told apart from no seed.
+func TestDecisionCacheKeyCoversSamplingParams(t *testing.T) {
+	cfg := func(params map[string]float64) ResolvedPlayerModelConfig {
+		return ResolvedPlayerModelConfig{PlayerModelConfig: PlayerModelConfig{Model: "m", Params: params}}
+	}
+	keys := map[string]string{}
+	for name, params := range map[string]map[string]float64{
+		"unset":  {},
+		"seed 0": {"seed": 0},
+		"seed 1": {"seed": 1},
+		"top_p":  {"top_p": 0.5},
+	} {
+		key := decisionCacheKey(cfg(params), "prompt")
+		if other, dup := keys[key]; dup {
+			t.Fatalf("%s and %s share a cache key", name, other)
+		}
+		keys[key] = name
+	}
+}
+
+func TestOpenAICompatibleProviderServesRepeatPromptFromCache(t *testing.T) {
+	// The cache is process-wide; a fresh one keeps this test independent of
+	// whatever an earlier run (-count=2) or another test left in it.
+	restore := sharedDecisionCache
+	sharedDecisionCache = newDecisionCache()
+	defer func() { sharedDecisionCache = restore }()
+
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "cache-test-model",
+			BaseURL:        "https://example.invalid/v1/chat/completions",
+			TimeoutSeconds: 5,
+			Params:         map[string]float64{"temperature": 0, "cache_size": 8},
+		},
+		APIKey: "test-key",
+	})
+	calls := 0
+	provider.client = &http.Client{
+		Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+			calls++
+			body := `{"choices":[{"message":{"content":"{\"action\":\"invest\"}"}}],"usage":{"prompt_tokens":10,"completion_tokens":5}}`
+			return &http.Response{
+				StatusCode: 200,
+				Body:       io.NopCloser(strings.NewReader(body)),
+				Header:     make(http.Header),
+			}, nil
+		}),
+	}
+
+	state := minimalProviderGameState()
+	first, err := provider.GetTowerDecision(state)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	second, err := provider.GetTowerDecision(state)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if calls != 1 {
+		t.Fatalf("expected one HTTP call for two identical prompts, got %d", calls)
+	}
+	if first["action"] != "invest" || second["action"] != "invest" {
+		t.Fatalf("expected both decisions to be invest, got %v and %v", first["action"], second["action"])
+	}
+	if _, ok := takeTokenUsage(second); ok {
+		t.Fatalf("expected a cache hit to carry no token usage")
+	}
+	if takeCacheHit(first) || !takeCacheHit(second) {
+		t.Fatalf("expected only the second decision to be marked as a cache hit")
+	}
+}
+
+// TestProcessPendingTurnResultsCountsCacheHitsApart checks that a turn
+// answered from the cache is counted as a hit, not as a provider call, and
+// adds nothing to the latency the per-call average is computed from.
+func TestProcessPendingTurnResultsCountsCacheHitsApart(t *testing.T) {
+	g := NewGame("test", "test")
+	g.PauseBetweenTurns = false
+	g.GameOver = true // skip applyDecision side effects; telemetry is recorded first
+
+	g.pendingTurnResults <- turnResult{playerID: g.Player1, role: "defender", decision: map[string]interface{}{"action": "save"}, latency: 800 * time.Millisecond}
+	hit := map[string]interface{}{"action": "save"}
+	markCacheHit(hit)
+	g.pendingTurnResults <- turnResult{playerID: g.Player1, role: "defender", decision: hit, latency: time.Millisecond}
+
+	g.processPendingTurnResults()
+
+	if g.ProviderCalls[g.Player1] != 1 || g.ProviderCacheHits[g.Player1] != 1 {
+		t.Fatalf("expected 1 call and 1 cache hit, got %d and %d", g.ProviderCalls[g.Player1], g.ProviderCacheHits[g.Player1])
+	}
+	if g.ProviderLatencyMS[g.Player1] != 800 {
+		t.Fatalf("expected the hit to add no latency, got %dms", g.ProviderLatencyMS[g.Player1])
+	}
+	if _, marked := hit[cacheHitKey]; marked {
+		t.Fatalf("expected the cache-hit mark to be stripped before the decision is applied")
+	}
+	if got := g.BuildMatchResult().ProviderCacheHits[g.Player1]; got != 1 {
+		t.Fatalf("expected the match result to record 1 cache hit, got %d", got)
+	}
+}
@@ -0,0 +1,141 @@
+package engine
+
+// Structured output (params.structured_output) asks the provider to constrain
+// decoding to a JSON schema for the role's decision, instead of relying on
+// the prompt alone to get a bare JSON object back. The model can then no
+// longer answer in prose, wrap the object in a code fence, or invent an
+// action name: the parse-failure fallbacks in parseTowerResponse /
+// parseEnemyResponse stop firing, and the output is just the object, which
+// is also the fewest tokens the model can spend on a turn.
+//
+// The response still goes through the same parser and normalizeDecision as
+// free-form text. A schema bounds the shape; it cannot know that a position
+// is on the path or a tower id does not exist, so validation stays where it
+// is.
+//
+// The schemas are fixed per role rather than narrowed to this turn's
+// affordable actions. The menu in the user message already does that, and a
+// schema that changed every turn would be one more thing a provider could not
+// reuse between requests.
+
+// decisionSchemaField is one property of a decision object, in a form both
+// providers' schema dialects can be rendered from.
+type decisionSchemaField struct {
+	Name string
+	Type string // "string", "integer" or "position"
+	Enum []string
+}
+
+var defenderDecisionFields = []decisionSchemaField{
+	{Name: "action", Type: "string", Enum: []string{"place", "upgrade", "place_slow_zone", "research", "invest", "save"}},
+	{Name: "tower_type", Type: "string", Enum: placeableTowerTypes},
+	{Name: "position", Type: "position"},
+	{Name: "tower_id", Type: "integer"},
+	{Name: "tech", Type: "string", Enum: []string{"economy", "range", "control"}},
+	{Name: "reason", Type: "string"},
+	{Name: "taunt", Type: "string"},
+}
+
+var attackerDecisionFields = []decisionSchemaField{
+	{Name: "action", Type: "string", Enum: []string{"spawn", "wave", "ability", "invest", "save"}},
+	{Name: "enemy_type", Type: "string", Enum: attackerEnemyTypes},
+	{Name: "ability", Type: "string", Enum: []string{"surge", "shield_burst", "reinforce_wave"}},
+	{Name: "reason", Type: "string"},
+	{Name: "taunt", Type: "string"},
+}
+
+func decisionFieldsForRole(role string) []decisionSchemaField {
+	if role == "defender" {
+		return defenderDecisionFields
+	}
+	return attackerDecisionFields
+}
+
+// structuredOutputEnabled reports whether params.structured_output is set.
+func structuredOutputEnabled(config ResolvedPlayerModelConfig) bool {
+	return config.Params["structured_output"] > 0
+}
+
+// openAIResponseFormat renders a role's schema as an OpenAI json_schema
+// response_format in strict mode. Strict mode requires every property to be
+// listed as required and additionalProperties to be false, so fields an
+// action does not use are nullable rather than optional; a null comes
+// through the parser as a missing value, which is what the normalizer
+// already expects for them.
+func openAIResponseFormat(role string) map[string]interface{} {
+	fields := decisionFieldsForRole(role)
+	properties := make(map[string]interface{}, len(fields))
+	required := make([]string, 0, len(fields))
+	for _, f := range fields {
+		var prop map[string]interface{}
+		switch f.Type {
+		case "position":
+			prop = map[string]interface{}{
+				"type":        []string{"array", "null"},
+				"items":       map[string]interface{}{"type": "integer"},
+				"description": "[y, x]",
+			}
+		default:
+			prop = map[string]interface{}{"type": []string{f.Type, "null"}}
+		}
+		if f.Name == "action" {
+			prop["type"] = "string"
+		}
+		if len(f.Enum) > 0 {
+			enum := make([]interface{}, 0, len(f.Enum)+1)
+			for _, v := range f.Enum {
+				enum = append(enum, v)
+			}
+			if f.Name != "action" {
+				enum = append(enum, nil)
+			}
+			prop["enum"] = enum
+		}
+		properties[f.Name] = prop
+		required = append(required, f.Name)
+	}
+	return map[string]interface{}{
+		"type": "json_schema",
+		"json_schema": map[string]interface{}{
+			"name":   role + "_decision",
+			"strict": true,
+			"schema": map[string]interface{}{
+				"type":                 "object",
+				"properties":           properties,
+				"required":             required,
+				"additionalProperties": false,
+			},
+		},
+	}
+}
+
+// geminiResponseSchema renders a role's schema in the OpenAPI subset Gemini's
+// generationConfig.responseSchema accepts. Only action is required; the
+// other fields are simply optional, which that dialect supports directly.
+func geminiResponseSchema(role string) map[string]interface{} {
+	fields := decisionFieldsForRole(role)
+	properties := make(map[string]interface{}, len(fields))
+	for _, f := range fields {
+		var prop map[string]interface{}
+		switch f.Type {
+		case "position":
+			prop = map[string]interface{}{
+				"type":  "ARRAY",
+				"items": map[string]interface{}{"type": "INTEGER"},
+			}
+		case "integer":
+			prop = map[string]interface{}{"type": "INTEGER"}
+		default:
+			prop = map[string]interface{}{"type": "STRING"}
+		}
+		if len(f.Enum) > 0 {
+			prop["enum"] = f.Enum
+		}
+		properties[f.Name] = prop
+	}
+	return map[string]interface{}{
+		"type":       "OBJECT",
+		"properties": properties,
+		"required":   []string{"action"},
+	}
+}
@@ -0,0 +1,87 @@
+package engine
+
+import (
+	"encoding/json"
+	"io"
+	"net/http"
+	"strings"
+	"testing"
+)
+
+// TestDecisionSchemaActionsMatchNormalizer keeps the schema enums and the
+// normalizer in step: an action the schema allows but the normalizer
+// rejects would be forced by the provider and then silently replaced with
+// "save".
+func TestDecisionSchemaActionsMatchNormalizer(t *testing.T) {
+	for _, f := range defenderDecisionFields {
+		if f.Name != "action" {
+			continue
+		}
+		for _, action := range f.Enum {
+			if _, defaulted := normalizeDefenderAction(action); defaulted {
+				t.Fatalf("defender schema allows %q, which the normalizer rejects", action)
+			}
+		}
+	}
+	for _, f := range attackerDecisionFields {
+		if f.Name != "action" {
+			continue
+		}
+		for _, action := range f.Enum {
+			if _, defaulted := normalizeAttackerAction(action); defaulted {
+				t.Fatalf("attacker schema allows %q, which the normalizer rejects", action)
+			}
+		}
+	}
+}
+
+func TestOpenAICompatibleProviderSendsResponseFormatWhenStructured(t *testing.T) {
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "test-model",
+			BaseURL:        "https://example.invalid/v1/chat/completions",
+			TimeoutSeconds: 5,
+			Params:         map[string]float64{"structured_output": 1},
+		},
+		APIKey: "test-key",
+	})
+	var schemaName string
+	provider.client = &http.Client{
+		Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+			var payload struct {
+				ResponseFormat struct {
+					Type       string `json:"type"`
+					JSONSchema struct {
+						Name string `json:"name"`
+					} `json:"json_schema"`
+				} `json:"response_format"`
+			}
+			if err := json.NewDecoder(req.Body).Decode(&payload); err != nil {
+				t.Fatalf("decode request: %v", err)
+			}
+			if payload.ResponseFormat.Type != "json_schema" {
+				t.Fatalf("expected json_schema response_format, got %q", payload.ResponseFormat.Type)
+			}
+			schemaName = payload.ResponseFormat.JSONSchema.Name
+			body := `{"choices":[{"message":{"content":"{\"action\":\"spawn\",\"enemy_type\":\"tank\",\"ability\":null,\"reason\":null,\"taunt\":null}"}}]}`
+			return &http.Response{
+				StatusCode: 200,
+				Body:       io.NopCloser(strings.NewReader(body)),
+				Header:     make(http.Header),
+			}, nil
+		}),
+	}
+
+	decision, err := provider.GetEnemyDecision(minimalProviderGameState())
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if schemaName != "attacker_decision" {
+		t.Fatalf("expected attacker schema, got %q", schemaName)
+	}
+	normalized := normalizeDecision("attacker", decision)
+	if normalized["action"] != "spawn" || normalized["enemy_type"] != "tank" {
+		t.Fatalf("expected spawn tank with null optional fields, got %v", normalized)
+	}
+}
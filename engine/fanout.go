@@ -0,0 +1,42 @@
+package engine
+
+import "sync"
+
+// RunBounded calls fn(i) for every i in [0, n) with at most concurrency calls
+// in flight at once, and returns when all of them have finished. Callers
+// write into a pre-sized slice by index, so the order of results never
+// depends on which call happened to finish first.
+//
+// Matches are independent games -- each builds its own Game, rng and
+// providers -- so a live tournament spends almost all of its wall clock
+// waiting on provider round trips that have nothing to do with each other.
+// Overlapping them is the whole win; the bound exists because every extra
+// match in flight is another client against the same provider rate limit.
+// concurrency <= 1 runs the calls in order on the calling goroutine.
+//
+// fn has no way to fail the batch: every call runs. A caller whose work can
+// fail should check what it can before calling RunBounded (see
+// runTournament, which resolves every matchup's config up front) rather than
+// discover the failure after the rest of the batch has already run.
+func RunBounded(n, concurrency int, fn func(i int)) {
+	if concurrency <= 1 || n <= 1 {
+		for i := 0; i < n; i++ {
+			fn(i)
+		}
+		return
+	}
+	slots := make(chan struct{}, concurrency)
+	var wg sync.WaitGroup
+	for i := 0; i < n; i++ {
+		slots <- struct{}{}
+		wg.Add(1)
+		go func(i int) {
+			defer func() {
+				<-slots
+				wg.Done()
+			}()
+			fn(i)
+		}(i)
+	}
+	wg.Wait()
+}
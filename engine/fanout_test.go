@@ -0,0 +1,44 @@
+package engine
+
+import (
+	"sync"
+	"testing"
+	"time"
+)
+
+func TestRunBoundedRespectsConcurrencyLimit(t *testing.T) {
+	var mu sync.Mutex
+	inFlight, peak := 0, 0
+	seen := make([]bool, 20)
+	RunBounded(len(seen), 3, func(i int) {
+		mu.Lock()
+		inFlight++
+		if inFlight > peak {
+			peak = inFlight
+		}
+		mu.Unlock()
+		time.Sleep(2 * time.Millisecond)
+		mu.Lock()
+		inFlight--
+		seen[i] = true
+		mu.Unlock()
+	})
+	if peak > 3 {
+		t.Fatalf("expected at most 3 calls in flight, saw %d", peak)
+	}
+	for i, ok := range seen {
+		if !ok {
+			t.Fatalf("expected every index to run, index %d did not", i)
+		}
+	}
+}
+
+func TestRunBoundedSequentialKeepsOrder(t *testing.T) {
+	order := []int{}
+	RunBounded(5, 1, func(i int) { order = append(order, i) })
+	for i, got := range order {
+		if got != i {
+			t.Fatalf("expected in-order execution at concurrency 1, got %v", order)
+		}
+	}
+}
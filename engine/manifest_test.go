@@ -117,7 +117,7 @@ func TestManifestRecordsProviderConfig(t *testing.T) {
 				APIKeyEnv:      "KEY_A",
 				BaseURL:        "https://example.invalid/v1/chat/completions",
 				TimeoutSeconds: 5,
-				Params:         map[string]float64{"temperature": 0.2, "max_tokens": 500, "retry_count": 2},
+				Params:         map[string]float64{"temperature": 0.2, "max_tokens": 500, "retry_count": 2, "top_p": 0.9, "seed": 0},
 			},
 			APIKey: "key-a",
 		},
@@ -159,6 +159,12 @@ func TestManifestRecordsProviderConfig(t *testing.T) {
 	if p1.RetryCount != 2 {
 		t.Fatalf("expected overridden retry_count 2, got %d", p1.RetryCount)
 	}
+	if p1.TopP == nil || *p1.TopP != 0.9 {
+		t.Fatalf("expected top_p 0.9 to be recorded, got %v", p1.TopP)
+	}
+	if p1.Seed == nil || *p1.Seed != 0 {
+		t.Fatalf("expected an explicit seed of 0 to be recorded, got %v", p1.Seed)
+	}
 
 	p2, ok := m.Providers[g.Player2]
 	if !ok {
@@ -176,6 +182,9 @@ func TestManifestRecordsProviderConfig(t *testing.T) {
 	if p2.RetryCount != 3 {
 		t.Fatalf("expected default retry_count 3 when unset, got %d", p2.RetryCount)
 	}
+	if p2.TopP != nil || p2.Seed != nil {
+		t.Fatalf("expected top_p and seed to stay unrecorded when unset, got %v / %v", p2.TopP, p2.Seed)
+	}
 
 	raw, err := json.Marshal(m)
 	if err != nil {
@@ -188,6 +197,9 @@ func TestManifestRecordsProviderConfig(t *testing.T) {
 	if decoded.Providers[g.Player1].Temperature != 0.2 {
 		t.Fatalf("expected overridden temperature to round-trip through JSON, got %v", decoded.Providers[g.Player1].Temperature)
 	}
+	if seed := decoded.Providers[g.Player1].Seed; seed == nil || *seed != 0 {
+		t.Fatalf("expected seed 0 to round-trip through JSON, got %v", seed)
+	}
 	if decoded.Providers[g.Player2].Temperature != defaultTemperature {
 		t.Fatalf("expected default temperature %v to round-trip through JSON, got %v", defaultTemperature, decoded.Providers[g.Player2].Temperature)
 	}
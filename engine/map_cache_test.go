@@ -37,3 +37,34 @@ func TestCanPlaceTowerAtUsesCachedPathAndObstacleTiles(t *testing.T) {
 		t.Fatalf("expected on_obstacle rejection, got ok=%v reason=%s", ok, reason)
 	}
 }
+
+func TestCanPlaceTowerAtTracksPlacedAndAssignedTowers(t *testing.T) {
+	g := NewGame("test", "test")
+	g.SetMapType("straight")
+	g.Resources[g.Defender] = 1000
+
+	y, x, ok := g.findNearestTowerPlacement(0, 0, 20)
+	if !ok {
+		t.Fatalf("expected a legal placement")
+	}
+	if !g.placeTower(y, x, "basic") {
+		t.Fatalf("expected placement at (%d,%d) to succeed", y, x)
+	}
+	if ok, reason := g.canPlaceTowerAt(y, x); ok || reason != "occupied_by_tower" {
+		t.Fatalf("expected occupied_by_tower after placeTower, got ok=%v reason=%s", ok, reason)
+	}
+
+	// Replacing g.Towers wholesale must not leave the occupancy grid stale.
+	y2, x2, ok := g.findNearestTowerPlacement(y, x, 20)
+	if !ok {
+		t.Fatalf("expected a second legal placement")
+	}
+	moved := NewTower(y2, x2, "basic", nil)
+	g.Towers = []*Tower{&moved}
+	if ok, _ := g.canPlaceTowerAt(y, x); !ok {
+		t.Fatalf("expected (%d,%d) to be free once g.Towers no longer holds it", y, x)
+	}
+	if ok, reason := g.canPlaceTowerAt(y2, x2); ok || reason != "occupied_by_tower" {
+		t.Fatalf("expected occupied_by_tower at (%d,%d), got ok=%v reason=%s", y2, x2, ok, reason)
+	}
+}
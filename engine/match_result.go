@@ -85,6 +85,7 @@ func (g *Game) BuildMatchResult() MatchResult {
 		DurationMillis:     duration.Milliseconds(),
 		ReplayEvents:       len(g.ReplayEvents),
 		ReplayTruncated:    g.ReplayTruncated,
+		ProviderCacheHits:  copyIntMap(g.ProviderCacheHits),
 		Strata:             g.matchStrata(),
 	}
 	result.ModelAuthoredShare = map[string]float64{}
@@ -274,8 +275,16 @@ func (r MatchResult) DefenderHeld() bool {
 // ResolveTimeout ends a match that hit its tick limit. Surviving the full
 // horizon is a defender win — the attacker failed to finish the job — so
 // "winner: none" stalemates no longer exist for bounded runs.
+//
+// Every match runner calls this once the tick loop is done, so it is also
+// where any provider request still in flight is abandoned -- including for a
+// match that already ended on its own.
 func (g *Game) ResolveTimeout() {
-	if g == nil || g.GameOver {
+	if g == nil {
+		return
+	}
+	g.CancelPendingTurns()
+	if g.GameOver {
 		return
 	}
 	g.GameOver = true
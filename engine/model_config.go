@@ -61,6 +61,28 @@ type ProviderConfigRecord struct {
 	RetryCount     int          `json:"retry_count"`
 	MaxTokens      int          `json:"max_tokens"`
 	Temperature    float64      `json:"temperature"`
+	// CacheSize is the effective decision-cache capacity, 0 when responses
+	// were not cached -- including when params.cache_size was set but the
+	// temperature was not 0. See decisionCacheCapacity.
+	CacheSize int `json:"cache_size,omitempty"`
+	// Stream records whether responses were streamed and cut off at the
+	// first complete decision. See streamingEnabled.
+	Stream bool `json:"stream,omitempty"`
+	// SystemMessage records whether the static half of the prompt went out
+	// as a separate system message. See systemMessageEnabled.
+	SystemMessage bool `json:"system_message,omitempty"`
+	// StructuredOutput records whether decoding was constrained to the
+	// role's decision schema. See decision_schema.go.
+	StructuredOutput bool `json:"structured_output,omitempty"`
+	// RPM and TPM are the client-side request and token-per-minute limits
+	// the provider paced itself to, 0 when unlimited. See rateLimiter.
+	RPM int `json:"rpm,omitempty"`
+	TPM int `json:"tpm,omitempty"`
+	// TopP and Seed are the sampling parameters passed through when set, nil
+	// when the provider's own default applied. Pointers, so that a chosen
+	// seed of 0 is recorded rather than dropped by omitempty.
+	TopP *float64 `json:"top_p,omitempty"`
+	Seed *int64   `json:"seed,omitempty"`
 }
 
 // newProviderConfigRecord resolves the same effective values the live
@@ -69,15 +91,28 @@ type ProviderConfigRecord struct {
 // provider implementations) so the manifest reflects what actually ran,
 // including defaults that were never explicitly set (e.g. temperature 0.7).
 func newProviderConfigRecord(config ResolvedPlayerModelConfig) ProviderConfigRecord {
-	return ProviderConfigRecord{
-		Provider:       config.Provider,
-		Model:          config.Model,
-		BaseURL:        config.BaseURL,
-		TimeoutSeconds: config.TimeoutSeconds,
-		RetryCount:     providerRetryAttempts(config),
-		MaxTokens:      completionTokenBudget(config.Params),
-		Temperature:    resolvedTemperature(config.Params),
-	}
+	record := ProviderConfigRecord{
+		Provider:         config.Provider,
+		Model:            config.Model,
+		BaseURL:          config.BaseURL,
+		TimeoutSeconds:   config.TimeoutSeconds,
+		RetryCount:       providerRetryAttempts(config),
+		MaxTokens:        completionTokenBudget(config.Params),
+		Temperature:      resolvedTemperature(config.Params),
+		CacheSize:        decisionCacheCapacity(config),
+		Stream:           streamingEnabled(config),
+		SystemMessage:    systemMessageEnabled(config),
+		StructuredOutput: structuredOutputEnabled(config),
+		RPM:              int(config.Params["rpm"]),
+		TPM:              int(config.Params["tpm"]),
+	}
+	if topP, ok := samplingTopP(config.Params); ok {
+		record.TopP = &topP
+	}
+	if seed, ok := samplingSeed(config.Params); ok {
+		record.Seed = &seed
+	}
+	return record
 }
 
 func DefaultMatchConfig() MatchConfig {
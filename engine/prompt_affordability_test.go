@@ -100,3 +100,41 @@ func TestParseTowerResponseRespectsSave(t *testing.T) {
 		t.Fatalf("expected save preserved, got %v", got["action"])
 	}
 }
+
+func TestFormatAffordableActionsCollapsesPerTowerUpgrades(t *testing.T) {
+	state := map[string]interface{}{"affordable_actions": []string{"save", "upgrade:0", "upgrade:1", "upgrade:7", "invest"}}
+	if got := formatAffordableActions(state); got != "save, upgrade:<tower_id>, invest" {
+		t.Fatalf("got %q", got)
+	}
+}
+
+func TestSummarizePromptStateUsesCompactNotation(t *testing.T) {
+	g := NewGame("test", "test")
+	summary := summarizePromptState(g.getPlayerGameState(g.Attacker, "attacker"))
+	for _, noise := range []string{"map[", "description", "[["} {
+		if strings.Contains(summary, noise) {
+			t.Fatalf("summary still carries %q:\n%s", noise, summary)
+		}
+	}
+	if !strings.Contains(summary, "attacker_abilities: surge=0 shield_burst=0 reinforce_wave=0") {
+		t.Fatalf("expected ability cooldowns as name=ticks:\n%s", summary)
+	}
+	// With no rejections the line is left out: the static advice reads any
+	// last_rejected_reason value as a rejection to react to.
+	if strings.Contains(summary, "last_rejected_reason") {
+		t.Fatalf("expected no last_rejected_reason line without rejections:\n%s", summary)
+	}
+	g.LastRejectedReason[g.Attacker] = "rejected:insufficient_resources"
+	summary = summarizePromptState(g.getPlayerGameState(g.Attacker, "attacker"))
+	if !strings.Contains(summary, "last_rejected_reason: "+g.Attacker+"=rejected:insufficient_resources") {
+		t.Fatalf("expected the rejection to be listed:\n%s", summary)
+	}
+}
+
+func TestPromptStateLegendDescribesAbilitiesFromGameData(t *testing.T) {
+	for _, ability := range availableAttackerAbilities() {
+		if !strings.Contains(promptStateLegend, ability.Name+": "+ability.Description) {
+			t.Fatalf("legend is missing %s's description:\n%s", ability.Name, promptStateLegend)
+		}
+	}
+}
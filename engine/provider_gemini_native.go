@@ -2,25 +2,23 @@ package engine
 
 import (
 	"bytes"
+	"context"
 	"encoding/json"
 	"fmt"
 	"net/http"
-	"time"
 )
 
 type GeminiNativeProvider struct {
-	config ResolvedPlayerModelConfig
-	client *http.Client
+	config  ResolvedPlayerModelConfig
+	client  *http.Client
+	limiter *rateLimiter // nil unless params.rpm or params.tpm is set
 }
 
 func NewGeminiNativeProvider(config ResolvedPlayerModelConfig) *GeminiNativeProvider {
-	timeout := time.Duration(config.TimeoutSeconds) * time.Second
-	if timeout <= 0 {
-		timeout = 20 * time.Second
-	}
 	return &GeminiNativeProvider{
-		config: config,
-		client: &http.Client{Timeout: timeout},
+		config:  config,
+		client:  newProviderHTTPClient(config.TimeoutSeconds),
+		limiter: providerRateLimiter(config),
 	}
 }
 
@@ -29,8 +27,16 @@ func (p *GeminiNativeProvider) Name() string {
 }
 
 func (p *GeminiNativeProvider) GetTowerDecision(gameState map[string]interface{}) (map[string]interface{}, error) {
-	prompt := (&OpenAIHandler{}).createTowerPrompt(gameState)
-	text, usage, finishReason, err := p.generateContent(prompt)
+	return p.GetTowerDecisionContext(context.Background(), gameState)
+}
+
+func (p *GeminiNativeProvider) GetEnemyDecision(gameState map[string]interface{}) (map[string]interface{}, error) {
+	return p.GetEnemyDecisionContext(context.Background(), gameState)
+}
+
+func (p *GeminiNativeProvider) GetTowerDecisionContext(ctx context.Context, gameState map[string]interface{}) (map[string]interface{}, error) {
+	prompt := (&OpenAIHandler{}).towerPrompt(gameState)
+	text, usage, finishReason, hit, err := p.cachedGenerateContent(ctx, prompt)
 	if err != nil {
 		// A network error must not become a gameplay action: tagged as an
 		// engine substitution, and -- unlike before -- the real error is
@@ -46,12 +52,15 @@ func (p *GeminiNativeProvider) GetTowerDecision(gameState map[string]interface{}
 		overrideDecisionSource(decision, SourceParserFallbackTruncated)
 	}
 	attachTokenUsage(decision, usage)
+	if hit {
+		markCacheHit(decision)
+	}
 	return decision, decErr
 }
 
-func (p *GeminiNativeProvider) GetEnemyDecision(gameState map[string]interface{}) (map[string]interface{}, error) {
-	prompt := (&GeminiHandler{}).createEnemyPrompt(gameState)
-	text, usage, finishReason, err := p.generateContent(prompt)
+func (p *GeminiNativeProvider) GetEnemyDecisionContext(ctx context.Context, gameState map[string]interface{}) (map[string]interface{}, error) {
+	prompt := (&GeminiHandler{}).enemyPrompt(gameState)
+	text, usage, finishReason, hit, err := p.cachedGenerateContent(ctx, prompt)
 	if err != nil {
 		// Was getFallbackEnemyDecision(100), which -- since 100 >= 50 --
 		// always produced "spawn tank" regardless of game state. A network
@@ -66,29 +75,71 @@ func (p *GeminiNativeProvider) GetEnemyDecision(gameState map[string]interface{}
 		overrideDecisionSource(decision, SourceParserFallbackTruncated)
 	}
 	attachTokenUsage(decision, usage)
+	if hit {
+		markCacheHit(decision)
+	}
 	return decision, decErr
 }
 
+// cachedGenerateContent consults the shared decision cache before going to
+// the network; see decisionCache. A response cut off at MAX_TOKENS is never
+// stored -- replaying it would replay the truncation -- so a hit's finish
+// reason is reported as "" (unknown) rather than claimed to be "STOP". The
+// bool reports a hit, which the game loop does not count as a provider call.
+func (p *GeminiNativeProvider) cachedGenerateContent(ctx context.Context, prompt rolePrompt) (string, tokenUsage, string, bool, error) {
+	capacity := decisionCacheCapacity(p.config)
+	if capacity == 0 {
+		text, usage, finishReason, err := p.generateContent(ctx, prompt)
+		return text, usage, finishReason, false, err
+	}
+	key := decisionCacheKey(p.config, prompt.joined())
+	if text, ok := sharedDecisionCache.get(key); ok {
+		return text, tokenUsage{}, "", true, nil
+	}
+	text, usage, finishReason, err := p.generateContent(ctx, prompt)
+	if err == nil && finishReason != "MAX_TOKENS" {
+		sharedDecisionCache.put(key, text, capacity)
+	}
+	return text, usage, finishReason, false, err
+}
+
 // generateContent returns the response text, token usage, and the Gemini
 // finishReason ("STOP", "MAX_TOKENS", "SAFETY", ...) alongside any error.
 // finishReason is "" whenever it could not be read off the response, which
 // callers must treat as "unknown", not as "STOP".
-func (p *GeminiNativeProvider) generateContent(prompt string) (string, tokenUsage, string, error) {
+//
+// The prompt goes out as a single part with the match-static half first
+// rather than as a systemInstruction: not every model served through this
+// endpoint accepts one, and Gemini's implicit context caching keys on the
+// request prefix either way, so putting the static text at the front is what
+// earns the cache hit.
+func (p *GeminiNativeProvider) generateContent(ctx context.Context, prompt rolePrompt) (string, tokenUsage, string, error) {
 	temperature := resolvedTemperature(p.config.Params)
 	maxTokens := completionTokenBudget(p.config.Params)
 
+	generationConfig := map[string]interface{}{
+		"temperature":     temperature,
+		"maxOutputTokens": maxTokens,
+	}
+	if topP, ok := samplingTopP(p.config.Params); ok {
+		generationConfig["topP"] = topP
+	}
+	if seed, ok := samplingSeed(p.config.Params); ok {
+		generationConfig["seed"] = seed
+	}
+	if structuredOutputEnabled(p.config) {
+		generationConfig["responseMimeType"] = "application/json"
+		generationConfig["responseSchema"] = geminiResponseSchema(prompt.Role)
+	}
 	reqBody := map[string]interface{}{
 		"contents": []map[string]interface{}{
 			{
 				"parts": []map[string]string{
-					{"text": prompt},
+					{"text": prompt.joined()},
 				},
 			},
 		},
-		"generationConfig": map[string]interface{}{
-			"temperature":     temperature,
-			"maxOutputTokens": maxTokens,
-		},
+		"generationConfig": generationConfig,
 	}
 	reqJSON, err := json.Marshal(reqBody)
 	if err != nil {
@@ -96,12 +147,27 @@ func (p *GeminiNativeProvider) generateContent(prompt string) (string, tokenUsag
 	}
 
 	url := fmt.Sprintf("%s?key=%s", p.config.BaseURL, p.config.APIKey)
+	tokenEstimate := estimateRequestTokens(prompt.joined(), maxTokens)
 	var lastErr error
+	retryAfter := ""
 	for attempt := 0; attempt < providerRetryAttempts(p.config); attempt++ {
-		req, reqErr := http.NewRequest("POST", url, bytes.NewReader(reqJSON))
+		if attempt > 0 {
+			if sleepErr := providerSleep(ctx, providerBackoff(attempt, retryAfter)); sleepErr != nil {
+				return "", tokenUsage{}, "", wrapProviderError(p.Name(), "http call", sleepErr)
+			}
+			retryAfter = ""
+		}
+		if ctxErr := ctx.Err(); ctxErr != nil {
+			return "", tokenUsage{}, "", wrapProviderError(p.Name(), "http call", ctxErr)
+		}
+		if p.limiter != nil {
+			if waitErr := p.limiter.wait(ctx, tokenEstimate); waitErr != nil {
+				return "", tokenUsage{}, "", wrapProviderError(p.Name(), "http call", waitErr)
+			}
+		}
+		req, reqErr := http.NewRequestWithContext(ctx, "POST", url, bytes.NewReader(reqJSON))
 		if reqErr != nil {
-			lastErr = wrapProviderError(p.Name(), "build request", reqErr)
-			continue
+			return "", tokenUsage{}, "", wrapProviderError(p.Name(), "build request", reqErr)
 		}
 		req.Header.Set("Content-Type", "application/json")
 		for key, value := range p.config.Headers {
@@ -111,17 +177,24 @@ func (p *GeminiNativeProvider) generateContent(prompt string) (string, tokenUsag
 		resp, callErr := p.client.Do(req)
 		if callErr != nil {
 			lastErr = wrapProviderError(p.Name(), "http call", callErr)
+			if ctx.Err() != nil {
+				return "", tokenUsage{}, "", lastErr
+			}
 			continue
 		}
 		if resp.StatusCode < 200 || resp.StatusCode >= 300 {
 			lastErr = wrapProviderError(p.Name(), "http status", fmt.Errorf("status %d", resp.StatusCode))
-			resp.Body.Close()
+			retryAfter = resp.Header.Get("Retry-After")
+			closeProviderBody(resp)
+			if !retryableStatus(resp.StatusCode) {
+				return "", tokenUsage{}, "", lastErr
+			}
 			continue
 		}
 
 		var result map[string]interface{}
 		decodeErr := json.NewDecoder(resp.Body).Decode(&result)
-		resp.Body.Close()
+		closeProviderBody(resp)
 		if decodeErr != nil {
 			lastErr = wrapProviderError(p.Name(), "decode", decodeErr)
 			continue
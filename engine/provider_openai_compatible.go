@@ -2,25 +2,23 @@ package engine
 
 import (
 	"bytes"
+	"context"
 	"encoding/json"
 	"fmt"
 	"net/http"
-	"time"
 )
 
 type OpenAICompatibleProvider struct {
-	config ResolvedPlayerModelConfig
-	client *http.Client
+	config  ResolvedPlayerModelConfig
+	client  *http.Client
+	limiter *rateLimiter // nil unless params.rpm or params.tpm is set
 }
 
 func NewOpenAICompatibleProvider(config ResolvedPlayerModelConfig) *OpenAICompatibleProvider {
-	timeout := time.Duration(config.TimeoutSeconds) * time.Second
-	if timeout <= 0 {
-		timeout = 20 * time.Second
-	}
 	return &OpenAICompatibleProvider{
-		config: config,
-		client: &http.Client{Timeout: timeout},
+		config:  config,
+		client:  newProviderHTTPClient(config.TimeoutSeconds),
+		limiter: providerRateLimiter(config),
 	}
 }
 
@@ -29,8 +27,16 @@ func (p *OpenAICompatibleProvider) Name() string {
 }
 
 func (p *OpenAICompatibleProvider) GetTowerDecision(gameState map[string]interface{}) (map[string]interface{}, error) {
-	prompt := (&OpenAIHandler{}).createTowerPrompt(gameState)
-	content, usage, err := p.getChatCompletion(prompt)
+	return p.GetTowerDecisionContext(context.Background(), gameState)
+}
+
+func (p *OpenAICompatibleProvider) GetEnemyDecision(gameState map[string]interface{}) (map[string]interface{}, error) {
+	return p.GetEnemyDecisionContext(context.Background(), gameState)
+}
+
+func (p *OpenAICompatibleProvider) GetTowerDecisionContext(ctx context.Context, gameState map[string]interface{}) (map[string]interface{}, error) {
+	prompt := (&OpenAIHandler{}).towerPrompt(gameState)
+	content, usage, hit, err := p.cachedChatCompletion(ctx, prompt)
 	if err != nil {
 		// A network error must not become a gameplay action: no resource-
 		// derived fallback, just "save" tagged as an engine substitution, and
@@ -43,12 +49,15 @@ func (p *OpenAICompatibleProvider) GetTowerDecision(gameState map[string]interfa
 	}
 	decision, decErr := (&OpenAIHandler{}).parseTowerResponse(content)
 	attachTokenUsage(decision, usage)
+	if hit {
+		markCacheHit(decision)
+	}
 	return decision, decErr
 }
 
-func (p *OpenAICompatibleProvider) GetEnemyDecision(gameState map[string]interface{}) (map[string]interface{}, error) {
-	prompt := (&GeminiHandler{}).createEnemyPrompt(gameState)
-	content, usage, err := p.getChatCompletion(prompt)
+func (p *OpenAICompatibleProvider) GetEnemyDecisionContext(ctx context.Context, gameState map[string]interface{}) (map[string]interface{}, error) {
+	prompt := (&GeminiHandler{}).enemyPrompt(gameState)
+	content, usage, hit, err := p.cachedChatCompletion(ctx, prompt)
 	if err != nil {
 		// Was getFallbackEnemyDecision(100), which -- since 100 >= 50 --
 		// always produced "spawn tank" regardless of game state. A network
@@ -60,32 +69,112 @@ func (p *OpenAICompatibleProvider) GetEnemyDecision(gameState map[string]interfa
 	}
 	decision, decErr := (&GeminiHandler{}).parseEnemyResponse(content)
 	attachTokenUsage(decision, usage)
+	if hit {
+		markCacheHit(decision)
+	}
 	return decision, decErr
 }
 
-func (p *OpenAICompatibleProvider) getChatCompletion(prompt string) (string, tokenUsage, error) {
+// cachedChatCompletion consults the shared decision cache before going to the
+// network; see decisionCache. A hit spent no tokens, so it carries no usage,
+// and is reported so the game loop does not count it as a provider call.
+func (p *OpenAICompatibleProvider) cachedChatCompletion(ctx context.Context, prompt rolePrompt) (string, tokenUsage, bool, error) {
+	capacity := decisionCacheCapacity(p.config)
+	if capacity == 0 {
+		content, usage, err := p.getChatCompletion(ctx, prompt)
+		return content, usage, false, err
+	}
+	key := decisionCacheKey(p.config, prompt.joined())
+	if content, ok := sharedDecisionCache.get(key); ok {
+		return content, tokenUsage{}, true, nil
+	}
+	content, usage, err := p.getChatCompletion(ctx, prompt)
+	if err == nil {
+		sharedDecisionCache.put(key, content, capacity)
+	}
+	return content, usage, false, err
+}
+
+// systemMessageEnabled reports whether params.system_message is set, asking
+// for the match-static half of the prompt as a separate system message. It
+// is off by default for the same reason the Gemini provider never uses
+// systemInstruction: not every model behind an OpenAI-compatible URL accepts
+// a system role (some chat templates reject it outright), and since a 400 is
+// not retried such a model would lose every turn. Either way the static half
+// comes first, so the provider's prefix cache sees the same opening bytes.
+// The Gemini provider ignores it; see generateContent.
+func systemMessageEnabled(config ResolvedPlayerModelConfig) bool {
+	return config.Provider == ProviderOpenAICompatible && config.Params["system_message"] > 0
+}
+
+// chatMessages renders the prompt as a single user message, static half
+// first, or -- with params.system_message -- as a system message holding the
+// static half followed by a user message with the turn's state; see
+// rolePrompt.
+func chatMessages(config ResolvedPlayerModelConfig, prompt rolePrompt) []map[string]interface{} {
+	if systemMessageEnabled(config) {
+		return []map[string]interface{}{
+			{"role": "system", "content": prompt.System},
+			{"role": "user", "content": prompt.User},
+		}
+	}
+	return []map[string]interface{}{
+		{"role": "user", "content": prompt.joined()},
+	}
+}
+
+func (p *OpenAICompatibleProvider) getChatCompletion(ctx context.Context, prompt rolePrompt) (string, tokenUsage, error) {
 	temperature := resolvedTemperature(p.config.Params)
 	maxTokens := completionTokenBudget(p.config.Params)
 
 	reqBody := map[string]interface{}{
-		"model": p.config.Model,
-		"messages": []map[string]interface{}{
-			{"role": "user", "content": prompt},
-		},
+		"model":       p.config.Model,
+		"messages":    chatMessages(p.config, prompt),
 		"temperature": temperature,
 		"max_tokens":  maxTokens,
 	}
+	if topP, ok := samplingTopP(p.config.Params); ok {
+		reqBody["top_p"] = topP
+	}
+	if seed, ok := samplingSeed(p.config.Params); ok {
+		reqBody["seed"] = seed
+	}
+	if structuredOutputEnabled(p.config) {
+		reqBody["response_format"] = openAIResponseFormat(prompt.Role)
+	}
+	stream := streamingEnabled(p.config)
+	if stream {
+		// include_usage asks for a final usage chunk; it only arrives when
+		// the stream is read to the end, not when it is cut off early.
+		reqBody["stream"] = true
+		reqBody["stream_options"] = map[string]interface{}{"include_usage": true}
+	}
 	reqJSON, err := json.Marshal(reqBody)
 	if err != nil {
 		return "", tokenUsage{}, wrapProviderError(p.Name(), "marshal request", err)
 	}
 
+	tokenEstimate := estimateRequestTokens(prompt.joined(), maxTokens)
 	var lastErr error
+	retryAfter := ""
 	for attempt := 0; attempt < providerRetryAttempts(p.config); attempt++ {
-		req, reqErr := http.NewRequest("POST", p.config.BaseURL, bytes.NewReader(reqJSON))
+		if attempt > 0 {
+			if sleepErr := providerSleep(ctx, providerBackoff(attempt, retryAfter)); sleepErr != nil {
+				return "", tokenUsage{}, wrapProviderError(p.Name(), "http call", sleepErr)
+			}
+			retryAfter = ""
+		}
+		if ctxErr := ctx.Err(); ctxErr != nil {
+			return "", tokenUsage{}, wrapProviderError(p.Name(), "http call", ctxErr)
+		}
+		if p.limiter != nil {
+			if waitErr := p.limiter.wait(ctx, tokenEstimate); waitErr != nil {
+				return "", tokenUsage{}, wrapProviderError(p.Name(), "http call", waitErr)
+			}
+		}
+		req, reqErr := http.NewRequestWithContext(ctx, "POST", p.config.BaseURL, bytes.NewReader(reqJSON))
 		if reqErr != nil {
-			lastErr = wrapProviderError(p.Name(), "build request", reqErr)
-			continue
+			return "", tokenUsage{}, wrapProviderError(p.Name(), "build request", reqErr)
 		}
 		req.Header.Set("Authorization", "Bearer "+p.config.APIKey)
 		req.Header.Set("Content-Type", "application/json")
@@ -96,17 +185,37 @@ func (p *OpenAICompatibleProvider) getChatCompletion(prompt string) (string, tok
 		resp, callErr := p.client.Do(req)
 		if callErr != nil {
 			lastErr = wrapProviderError(p.Name(), "http call", callErr)
+			if ctx.Err() != nil {
+				return "", tokenUsage{}, lastErr
+			}
 			continue
 		}
 		if resp.StatusCode < 200 || resp.StatusCode >= 300 {
 			lastErr = wrapProviderError(p.Name(), "http status", fmt.Errorf("status %d", resp.StatusCode))
-			resp.Body.Close()
+			retryAfter = resp.Header.Get("Retry-After")
+			closeProviderBody(resp)
+			if !retryableStatus(resp.StatusCode) {
+				return "", tokenUsage{}, lastErr
+			}
 			continue
 		}
 
+		if stream {
+			content, usage, streamErr := readChatCompletionStream(resp.Body)
+			// Not drained: closing mid-stream is what stops the server
+			// generating tokens nobody will read. That costs the connection,
+			// which is the cheaper of the two.
+			resp.Body.Close()
+			if streamErr != nil {
+				lastErr = wrapProviderError(p.Name(), "decode", streamErr)
+				continue
+			}
+			return content, usage, nil
+		}
+
 		var result map[string]interface{}
 		decodeErr := json.NewDecoder(resp.Body).Decode(&result)
-		resp.Body.Close()
+		closeProviderBody(resp)
 		if decodeErr != nil {
 			lastErr = wrapProviderError(p.Name(), "decode", decodeErr)
 			continue
@@ -1,6 +1,9 @@
 package engine
 
 import (
+	"context"
+	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
 	"net/http"
@@ -122,3 +125,255 @@ func TestOpenAICompatibleProviderEnemyDecisionReturnsErrorOnFailure(t *testing.T
 		t.Fatalf("expected the provider-failure fallback to be a plain save, not a tactical spawn, got %v", decision["action"])
 	}
 }
+
+// TestOpenAICompatibleProviderStopsOnCancelledContext guards the turn
+// worker's cancellation path: once the match is over, a provider call must
+// give up rather than spend its remaining retries against the network.
+func TestOpenAICompatibleProviderStopsOnCancelledContext(t *testing.T) {
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "test-model",
+			BaseURL:        "https://example.invalid/v1/chat/completions",
+			TimeoutSeconds: 5,
+		},
+		APIKey: "test-key",
+	})
+	calls := 0
+	provider.client = &http.Client{
+		Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+			calls++
+			return nil, fmt.Errorf("connection refused")
+		}),
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	decision, err := provider.GetTowerDecisionContext(ctx, minimalProviderGameState())
+	if !errors.Is(err, context.Canceled) {
+		t.Fatalf("expected context.Canceled, got %v", err)
+	}
+	if calls != 0 {
+		t.Fatalf("expected no request after cancellation, got %d", calls)
+	}
+	if decision["action"] != "save" {
+		t.Fatalf("expected the provider-failure fallback to be a plain save, got %v", decision["action"])
+	}
+}
+
+// TestOpenAICompatibleProviderSendsStaticSystemPrefix pins the prompt split
+// under params.system_message: the system message must be byte-identical from
+// turn to turn so providers can serve it from their prefix cache, and
+// everything that changes per turn must land in the user message instead.
+func TestOpenAICompatibleProviderSendsStaticSystemPrefix(t *testing.T) {
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "test-model",
+			BaseURL:        "https://example.invalid/v1/chat/completions",
+			TimeoutSeconds: 5,
+			Params:         map[string]float64{"system_message": 1},
+		},
+		APIKey: "test-key",
+	})
+	var sent []map[string]string
+	provider.client = &http.Client{
+		Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+			var payload struct {
+				Messages []map[string]string `json:"messages"`
+			}
+			if err := json.NewDecoder(req.Body).Decode(&payload); err != nil {
+				t.Fatalf("decode request: %v", err)
+			}
+			if len(payload.Messages) != 2 || payload.Messages[0]["role"] != "system" || payload.Messages[1]["role"] != "user" {
+				t.Fatalf("expected system then user message, got %v", payload.Messages)
+			}
+			sent = append(sent, map[string]string{"system": payload.Messages[0]["content"], "user": payload.Messages[1]["content"]})
+			body := `{"choices":[{"message":{"content":"{\"action\":\"save\"}"}}]}`
+			return &http.Response{
+				StatusCode: 200,
+				Body:       io.NopCloser(strings.NewReader(body)),
+				Header:     make(http.Header),
+			}, nil
+		}),
+	}
+
+	early := minimalProviderGameState()
+	late := minimalProviderGameState()
+	late["wave"] = 9
+	late["resources"] = map[string]interface{}{"p1": 735, "p2": 410}
+	for _, gs := range []map[string]interface{}{early, late} {
+		if _, err := provider.GetTowerDecision(gs); err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+	}
+
+	if sent[0]["system"] != sent[1]["system"] {
+		t.Fatalf("system message changed between turns:\n%q\n%q", sent[0]["system"], sent[1]["system"])
+	}
+	if sent[0]["user"] == sent[1]["user"] {
+		t.Fatalf("expected per-turn state in the user message")
+	}
+	if strings.Contains(sent[1]["system"], "735") || !strings.Contains(sent[1]["user"], "735") {
+		t.Fatalf("resources belong in the user message, not the system message")
+	}
+}
+
+// TestOpenAICompatibleProviderSendsSingleUserMessageByDefault checks the
+// default for endpoints that may reject a system role: one user message,
+// opening with the same static text every turn so the prefix cache still
+// applies.
+func TestOpenAICompatibleProviderSendsSingleUserMessageByDefault(t *testing.T) {
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "test-model",
+			BaseURL:        "https://example.invalid/v1/chat/completions",
+			TimeoutSeconds: 5,
+		},
+		APIKey: "test-key",
+	})
+	var sent []string
+	provider.client = &http.Client{
+		Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+			var payload struct {
+				Messages []map[string]string `json:"messages"`
+			}
+			if err := json.NewDecoder(req.Body).Decode(&payload); err != nil {
+				t.Fatalf("decode request: %v", err)
+			}
+			if len(payload.Messages) != 1 || payload.Messages[0]["role"] != "user" {
+				t.Fatalf("expected a single user message, got %v", payload.Messages)
+			}
+			sent = append(sent, payload.Messages[0]["content"])
+			body := `{"choices":[{"message":{"content":"{\"action\":\"save\"}"}}]}`
+			return &http.Response{
+				StatusCode: 200,
+				Body:       io.NopCloser(strings.NewReader(body)),
+				Header:     make(http.Header),
+			}, nil
+		}),
+	}
+
+	late := minimalProviderGameState()
+	late["wave"] = 9
+	for _, gs := range []map[string]interface{}{minimalProviderGameState(), late} {
+		if _, err := provider.GetTowerDecision(gs); err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+	}
+
+	static := (&OpenAIHandler{}).towerPrompt(minimalProviderGameState()).System
+	for i, content := range sent {
+		if !strings.HasPrefix(content, static) {
+			t.Fatalf("request %d does not open with the static prompt half", i)
+		}
+	}
+}
+
+// TestOpenAICompatibleProviderStreamStopsAtFirstDecision serves a stream
+// whose JSON is followed by a trailing explanation and a reader that fails if
+// it is consumed past the decision, so the test only passes if the provider
+// stops reading once the object is complete.
+func TestOpenAICompatibleProviderStreamStopsAtFirstDecision(t *testing.T) {
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "test-model",
+			BaseURL:        "https://example.invalid/v1/chat/completions",
+			TimeoutSeconds: 5,
+			Params:         map[string]float64{"stream": 1},
+		},
+		APIKey: "test-key",
+	})
+	chunks := []string{`{\"action\":\"place\",`, `\"tower_type\":\"basic\",`, `\"position\":[1,2]}`}
+	var sse strings.Builder
+	for _, c := range chunks {
+		fmt.Fprintf(&sse, "data: {\"choices\":[{\"delta\":{\"content\":\"%s\"}}]}\n\n", c)
+	}
+	provider.client = &http.Client{
+		Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+			var payload map[string]interface{}
+			if err := json.NewDecoder(req.Body).Decode(&payload); err != nil {
+				t.Fatalf("decode request: %v", err)
+			}
+			if payload["stream"] != true {
+				t.Fatalf("expected stream=true in request, got %v", payload["stream"])
+			}
+			body := io.MultiReader(strings.NewReader(sse.String()), failingReader{t})
+			return &http.Response{
+				StatusCode: 200,
+				Body:       io.NopCloser(body),
+				Header:     make(http.Header),
+			}, nil
+		}),
+	}
+
+	decision, err := provider.GetTowerDecision(minimalProviderGameState())
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if decision["action"] != "place" || decision["tower_type"] != "basic" {
+		t.Fatalf("expected streamed place decision, got %v", decision)
+	}
+}
+
+type failingReader struct{ t *testing.T }
+
+func (r failingReader) Read([]byte) (int, error) {
+	r.t.Fatalf("stream read past the complete decision")
+	return 0, io.EOF
+}
+
+// TestOpenAICompatibleProviderPassesSamplingParamsOnlyWhenSet checks that
+// top_p and seed go out as given -- a seed of 0 included -- and that an
+// unconfigured provider sends neither, leaving the server's defaults alone.
+func TestOpenAICompatibleProviderPassesSamplingParamsOnlyWhenSet(t *testing.T) {
+	for _, tc := range []struct {
+		params   map[string]float64
+		wantKeys bool
+	}{
+		{params: map[string]float64{"top_p": 0.9, "seed": 0}, wantKeys: true},
+		{params: nil, wantKeys: false},
+	} {
+		provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+			PlayerModelConfig: PlayerModelConfig{
+				Provider:       ProviderOpenAICompatible,
+				Model:          "test-model",
+				BaseURL:        "https://example.invalid/v1/chat/completions",
+				TimeoutSeconds: 5,
+				Params:         tc.params,
+			},
+			APIKey: "test-key",
+		})
+		var payload map[string]interface{}
+		provider.client = &http.Client{
+			Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+				if err := json.NewDecoder(req.Body).Decode(&payload); err != nil {
+					t.Fatalf("decode request: %v", err)
+				}
+				body := `{"choices":[{"message":{"content":"{\"action\":\"save\"}"}}]}`
+				return &http.Response{
+					StatusCode: 200,
+					Body:       io.NopCloser(strings.NewReader(body)),
+					Header:     make(http.Header),
+				}, nil
+			}),
+		}
+		if _, err := provider.GetTowerDecision(minimalProviderGameState()); err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+
+		topP, hasTopP := payload["top_p"]
+		seed, hasSeed := payload["seed"]
+		if !tc.wantKeys {
+			if hasTopP || hasSeed {
+				t.Fatalf("expected no top_p or seed when unset, got %v / %v", topP, seed)
+			}
+			continue
+		}
+		if topP != 0.9 || !hasSeed || seed != float64(0) {
+			t.Fatalf("expected top_p 0.9 and seed 0, got %v / %v (seed present: %t)", topP, seed, hasSeed)
+		}
+	}
+}
@@ -1,6 +1,9 @@
 package engine
 
-import "fmt"
+import (
+	"context"
+	"fmt"
+)
 
 type DecisionProvider interface {
 	Name() string
@@ -8,6 +11,18 @@ type DecisionProvider interface {
 	GetEnemyDecision(gameState map[string]interface{}) (map[string]interface{}, error)
 }
 
+// ContextDecisionProvider is implemented by providers whose decisions come
+// off the network. The turn worker (handlePlayerTurn) prefers it over the
+// plain DecisionProvider methods so a request still in flight when the match
+// ends can be abandoned, instead of holding its connection open -- and its
+// retries running -- until the HTTP timeout for a result nobody will apply.
+// The plain methods stay as the synchronous entry points and are equivalent
+// to calling these with context.Background().
+type ContextDecisionProvider interface {
+	GetTowerDecisionContext(ctx context.Context, gameState map[string]interface{}) (map[string]interface{}, error)
+	GetEnemyDecisionContext(ctx context.Context, gameState map[string]interface{}) (map[string]interface{}, error)
+}
+
 type DecisionRouter struct {
 	providers map[string]DecisionProvider
 }
@@ -1,10 +1,16 @@
 package engine
 
 import (
+	"context"
 	"errors"
 	"fmt"
+	"io"
+	"math/rand"
 	"net"
+	"net/http"
+	"strconv"
 	"strings"
+	"time"
 )
 
 func providerRetryAttempts(config ResolvedPlayerModelConfig) int {
@@ -31,6 +37,122 @@ func resolvedTemperature(params map[string]float64) float64 {
 	return defaultTemperature
 }
 
+// samplingTopP and samplingSeed return params.top_p and params.seed when
+// they are set, and false otherwise; unset, neither is sent and the provider
+// keeps its own default. A seed asks the provider to sample reproducibly, so
+// a replayed match at a nonzero temperature can draw the same answers again
+// -- best-effort, since providers only promise it for an unchanged backend.
+// Presence rather than value decides, because seed 0 is a seed like any
+// other.
+func samplingTopP(params map[string]float64) (float64, bool) {
+	v, ok := params["top_p"]
+	return v, ok
+}
+
+func samplingSeed(params map[string]float64) (int64, bool) {
+	v, ok := params["seed"]
+	return int64(v), ok
+}
+
+// Retries back off exponentially with full jitter: before attempt n (n >= 1)
+// the provider sleeps a random duration in [0, min(cap, base*2^(n-1))).
+// Retrying immediately, as the loops used to, spends the whole retry budget
+// inside the same rate-limit window or outage that caused the first failure;
+// the jitter keeps concurrent matches (see RunBounded) from retrying in
+// lockstep against the same endpoint.
+const (
+	providerBackoffBase = 500 * time.Millisecond
+	providerBackoffCap  = 8 * time.Second
+)
+
+// providerBackoff is the wait before retry attempt n (n >= 1). A Retry-After
+// header in seconds, as sent with 429 and 503 responses, overrides the
+// computed value when it asks for longer, still bounded by the cap.
+func providerBackoff(attempt int, retryAfter string) time.Duration {
+	ceiling := providerBackoffBase << (attempt - 1)
+	if ceiling <= 0 || ceiling > providerBackoffCap {
+		ceiling = providerBackoffCap
+	}
+	wait := time.Duration(rand.Int63n(int64(ceiling)))
+	if secs, err := strconv.Atoi(strings.TrimSpace(retryAfter)); err == nil && secs > 0 {
+		if hinted := time.Duration(secs) * time.Second; hinted > wait {
+			wait = hinted
+		}
+		if wait > providerBackoffCap {
+			wait = providerBackoffCap
+		}
+	}
+	return wait
+}
+
+// providerSleep waits d or until ctx is done, whichever comes first. Retry
+// backoff and the rate limiter both wait through it; it is a variable so
+// tests can make those waits instant.
+var providerSleep = func(ctx context.Context, d time.Duration) error {
+	timer := time.NewTimer(d)
+	defer timer.Stop()
+	select {
+	case <-timer.C:
+		return nil
+	case <-ctx.Done():
+		return ctx.Err()
+	}
+}
+
+// retryableStatus reports whether a non-2xx response is worth another
+// attempt: request timeouts, rate limits and server errors are transient;
+// any other 4xx (bad key, unknown model, malformed request) will fail the
+// same way every time, so the provider gives up on it at once instead of
+// spending the retry budget -- and the turn's latency -- on it.
+func retryableStatus(code int) bool {
+	return code == http.StatusRequestTimeout || code == http.StatusTooManyRequests || code >= 500
+}
+
+// sharedProviderTransport is the connection pool behind every live
+// provider's http.Client. Each match builds its own providers (see
+// providerFromResolvedConfig), so before this they all fell back to
+// http.DefaultTransport, which keeps only two idle connections per host:
+// with RunBounded running several matches against one API, every request
+// past the second found no idle connection and paid a fresh TCP and TLS
+// handshake -- often longer than a short completion itself. One pool sized
+// for that concurrency lets those requests reuse warm connections, and
+// ForceAttemptHTTP2 multiplexes them over one connection where the endpoint
+// supports it. Per-request timeouts stay on each http.Client.
+var sharedProviderTransport = &http.Transport{
+	Proxy:                 http.ProxyFromEnvironment,
+	DialContext:           (&net.Dialer{Timeout: 30 * time.Second, KeepAlive: 30 * time.Second}).DialContext,
+	ForceAttemptHTTP2:     true,
+	MaxIdleConns:          100,
+	MaxIdleConnsPerHost:   100,
+	IdleConnTimeout:       90 * time.Second,
+	TLSHandshakeTimeout:   10 * time.Second,
+	ExpectContinueTimeout: 1 * time.Second,
+}
+
+func newProviderHTTPClient(timeoutSeconds int) *http.Client {
+	timeout := time.Duration(timeoutSeconds) * time.Second
+	if timeout <= 0 {
+		timeout = 20 * time.Second
+	}
+	return &http.Client{Timeout: timeout, Transport: sharedProviderTransport}
+}
+
+// providerBodyDrainLimit bounds how much of an unread response body
+// closeProviderBody will read to keep the connection. An error page or the
+// newline after a decoded JSON object is a few bytes; anything much larger
+// is cheaper to abandon with the connection than to download.
+const providerBodyDrainLimit = 64 << 10
+
+// closeProviderBody reads what is left of a response body before closing it.
+// The transport only returns a connection to the pool once its body has been
+// read to EOF; closing early -- after a non-2xx status, or after the JSON
+// decoder has stopped at the end of the object -- discards the connection,
+// and the next request (typically the retry) pays for a new one.
+func closeProviderBody(resp *http.Response) {
+	io.Copy(io.Discard, io.LimitReader(resp.Body, providerBodyDrainLimit))
+	resp.Body.Close()
+}
+
 func providerErrorLabel(err error) string {
 	if err == nil {
 		return "none"
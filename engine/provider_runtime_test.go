@@ -1,8 +1,16 @@
 package engine
 
 import (
+	"context"
 	"errors"
+	"io"
+	"net"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"sync/atomic"
 	"testing"
+	"time"
 )
 
 func TestProviderRetryAttemptsFromParams(t *testing.T) {
@@ -33,3 +41,125 @@ func TestCompletionTokenBudget(t *testing.T) {
 		t.Fatalf("expected zero override to fall back to 4096, got %d", got)
 	}
 }
+
+func TestProviderBackoffStaysWithinCeiling(t *testing.T) {
+	for attempt := 1; attempt <= 8; attempt++ {
+		ceiling := providerBackoffBase << (attempt - 1)
+		if ceiling > providerBackoffCap {
+			ceiling = providerBackoffCap
+		}
+		for i := 0; i < 50; i++ {
+			if d := providerBackoff(attempt, ""); d < 0 || d >= ceiling {
+				t.Fatalf("attempt %d: backoff %v outside [0, %v)", attempt, d, ceiling)
+			}
+		}
+	}
+	if d := providerBackoff(1, "3"); d != 3*time.Second {
+		t.Fatalf("expected Retry-After of 3s to be honoured, got %v", d)
+	}
+	if d := providerBackoff(1, "120"); d != providerBackoffCap {
+		t.Fatalf("expected Retry-After to be capped at %v, got %v", providerBackoffCap, d)
+	}
+}
+
+// TestProviderRetriesOnlyTransientStatuses checks both halves of the retry
+// policy against one provider: a 503 is retried (after a backoff) until it
+// succeeds, and a 401 fails on the first response without sleeping at all.
+func TestProviderRetriesOnlyTransientStatuses(t *testing.T) {
+	var sleeps []time.Duration
+	restore := providerSleep
+	providerSleep = func(_ context.Context, d time.Duration) error {
+		sleeps = append(sleeps, d)
+		return nil
+	}
+	defer func() { providerSleep = restore }()
+
+	statuses := []int{}
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "test-model",
+			BaseURL:        "https://example.invalid/v1/chat/completions",
+			TimeoutSeconds: 5,
+		},
+		APIKey: "test-key",
+	})
+	provider.client = &http.Client{
+		Transport: roundTripFunc(func(req *http.Request) (*http.Response, error) {
+			status := statuses[0]
+			statuses = statuses[1:]
+			body := `{"choices":[{"message":{"content":"{\"action\":\"save\"}"}}]}`
+			return &http.Response{
+				StatusCode: status,
+				Body:       io.NopCloser(strings.NewReader(body)),
+				Header:     make(http.Header),
+			}, nil
+		}),
+	}
+
+	statuses = []int{503, 503, 200}
+	if _, err := provider.GetTowerDecision(minimalProviderGameState()); err != nil {
+		t.Fatalf("expected success on the third attempt, got %v", err)
+	}
+	if len(sleeps) != 2 {
+		t.Fatalf("expected a backoff before each retry, got %d", len(sleeps))
+	}
+
+	sleeps = nil
+	statuses = []int{401, 200, 200}
+	if _, err := provider.GetTowerDecision(minimalProviderGameState()); err == nil {
+		t.Fatalf("expected a 401 to fail the request")
+	}
+	if len(statuses) != 2 || len(sleeps) != 0 {
+		t.Fatalf("expected a 401 to stop after one request with no backoff, %d requests left, %d sleeps", len(statuses), len(sleeps))
+	}
+}
+
+// TestProviderReusesConnectionAcrossRetries checks that a non-2xx response
+// body is drained before it is closed: the retry that follows a 503 must go
+// out over the same connection instead of dialing a new one.
+func TestProviderReusesConnectionAcrossRetries(t *testing.T) {
+	restore := providerSleep
+	providerSleep = func(context.Context, time.Duration) error { return nil }
+	defer func() { providerSleep = restore }()
+
+	var requests int
+	server := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		if requests == 1 {
+			w.WriteHeader(http.StatusServiceUnavailable)
+			io.WriteString(w, `{"error":{"message":"overloaded, please retry"}}`)
+			return
+		}
+		io.WriteString(w, `{"choices":[{"message":{"content":"{\"action\":\"save\"}"}}]}`+"\n")
+	}))
+	var dials int32
+	server.Config.ConnState = func(_ net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			atomic.AddInt32(&dials, 1)
+		}
+	}
+	server.Start()
+	defer server.Close()
+
+	provider := NewOpenAICompatibleProvider(ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider:       ProviderOpenAICompatible,
+			Model:          "test-model",
+			BaseURL:        server.URL,
+			TimeoutSeconds: 5,
+		},
+		APIKey: "test-key",
+	})
+	for i := 0; i < 2; i++ {
+		if _, err := provider.GetTowerDecision(minimalProviderGameState()); err != nil {
+			t.Fatalf("request %d: %v", i, err)
+		}
+	}
+	if requests != 3 {
+		t.Fatalf("expected one retried request and one plain one, got %d requests", requests)
+	}
+	if got := atomic.LoadInt32(&dials); got != 1 {
+		t.Fatalf("expected all three requests on one connection, got %d connections", got)
+	}
+}
@@ -0,0 +1,112 @@
+package engine
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"io"
+	"strings"
+)
+
+// streamingEnabled reports whether an OpenAI-compatible request should be
+// sent with "stream": true (params.stream set to any positive value). It is
+// off by default: not every server behind an OpenAI-compatible URL speaks
+// server-sent events, and a streamed response that is cut short carries no
+// usage block, so token and cost accounting for those turns reads zero.
+// The Gemini provider ignores it; see generateContent.
+func streamingEnabled(config ResolvedPlayerModelConfig) bool {
+	return config.Provider == ProviderOpenAICompatible && config.Params["stream"] > 0
+}
+
+// readChatCompletionStream accumulates the delta.content of an OpenAI-style
+// server-sent event stream and returns as soon as the text holds a complete
+// decision object, without waiting for the rest of the stream. A model that
+// follows its JSON with an explanation -- or pads a fixed-length answer --
+// otherwise keeps the turn worker blocked for every one of those trailing
+// tokens. The caller closes the body, which is what actually stops the
+// server from sending them.
+//
+// A completeness check only runs when a chunk leaves the text ending in '}'
+// (ignoring trailing whitespace), so a long response is scanned a handful of
+// times rather than once per token. If the stream ends without a complete
+// object, whatever text arrived is returned and the usual parser decides
+// what to make of it, exactly as for a non-streamed response.
+func readChatCompletionStream(body io.Reader) (string, tokenUsage, error) {
+	scanner := bufio.NewScanner(body)
+	scanner.Buffer(make([]byte, 0, 64*1024), 1<<20)
+
+	var content strings.Builder
+	var usage tokenUsage
+	for scanner.Scan() {
+		line := scanner.Text()
+		if !strings.HasPrefix(line, "data:") {
+			continue
+		}
+		data := strings.TrimSpace(line[len("data:"):])
+		if data == "[DONE]" {
+			break
+		}
+		var chunk map[string]interface{}
+		if err := json.Unmarshal([]byte(data), &chunk); err != nil {
+			return "", tokenUsage{}, fmt.Errorf("stream chunk: %w", err)
+		}
+		if u, ok := extractOpenAIUsage(chunk); ok {
+			usage = u
+		}
+		delta, ok := extractOpenAIStreamDelta(chunk)
+		if !ok || delta == "" {
+			continue
+		}
+		content.WriteString(delta)
+		if strings.HasSuffix(strings.TrimRight(delta, " \t\r\n"), "}") && holdsCompleteDecision(content.String()) {
+			return content.String(), usage, nil
+		}
+	}
+	if err := scanner.Err(); err != nil {
+		return "", tokenUsage{}, err
+	}
+	if content.Len() == 0 {
+		return "", tokenUsage{}, fmt.Errorf("empty content")
+	}
+	return content.String(), usage, nil
+}
+
+// holdsCompleteDecision reports whether s contains a balanced, valid JSON
+// object with an "action" key -- the point at which parseTowerResponse /
+// parseEnemyResponse have everything they will use. The "action" check
+// keeps a stray brace pair in leading prose from ending the stream early.
+func holdsCompleteDecision(s string) bool {
+	for i := 0; i < len(s); i++ {
+		if s[i] != '{' {
+			continue
+		}
+		candidate, ok := scanBalancedJSONObject(s[i:])
+		if !ok {
+			return false
+		}
+		var decision map[string]interface{}
+		if json.Unmarshal([]byte(candidate), &decision) == nil {
+			if _, ok := decision["action"]; ok {
+				return true
+			}
+		}
+	}
+	return false
+}
+
+func extractOpenAIStreamDelta(chunk map[string]interface{}) (string, bool) {
+	choices, ok := chunk["choices"].([]interface{})
+	if !ok || len(choices) == 0 {
+		return "", false
+	}
+	choice, ok := choices[0].(map[string]interface{})
+	if !ok {
+		return "", false
+	}
+	delta, ok := choice["delta"].(map[string]interface{})
+	if !ok {
+		return "", false
+	}
+	content, ok := delta["content"].(string)
+	return content, ok
+}
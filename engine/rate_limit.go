@@ -0,0 +1,140 @@
+package engine
+
+import (
+	"context"
+	"fmt"
+	"sync"
+	"time"
+)
+
+// rateLimiter is a client-side token bucket over two budgets at once:
+// requests per minute and (estimated) tokens per minute, the two limits
+// hosted APIs enforce. A request proceeds only when both buckets hold enough;
+// otherwise the caller sleeps until the slower one has refilled. Staying
+// under the limits this way is cheaper than discovering them: a 429 costs a
+// round trip plus a backoff (see providerBackoff), and with several matches
+// running at once (RunBounded) they all hit the limit together and all back
+// off together, so throughput oscillates instead of holding at the ceiling.
+//
+// Both buckets start full and hold at most one minute of budget, so a fresh
+// process may burst up to the per-minute limit and is then paced.
+type rateLimiter struct {
+	mu        sync.Mutex
+	rpm, tpm  float64
+	requests  float64
+	tokens    float64
+	lastCheck time.Time
+}
+
+func newRateLimiter(rpm, tpm float64) *rateLimiter {
+	return &rateLimiter{rpm: rpm, tpm: tpm, requests: rpm, tokens: tpm, lastCheck: time.Now()}
+}
+
+// wait blocks until one request costing tokens may be sent, or ctx is done.
+// A zero rpm or tpm leaves that budget unlimited. A single request estimated
+// above the whole tpm budget is charged the full budget rather than waiting
+// forever for a bucket that can never hold it.
+func (l *rateLimiter) wait(ctx context.Context, tokens int) error {
+	need := float64(tokens)
+	if l.tpm > 0 && need > l.tpm {
+		need = l.tpm
+	}
+	for {
+		l.mu.Lock()
+		now := time.Now()
+		elapsed := now.Sub(l.lastCheck).Minutes()
+		l.lastCheck = now
+		l.requests = refill(l.requests, l.rpm, elapsed)
+		l.tokens = refill(l.tokens, l.tpm, elapsed)
+
+		var delay time.Duration
+		if l.rpm > 0 && l.requests < 1 {
+			delay = maxDuration(delay, minutesToDuration((1-l.requests)/l.rpm))
+		}
+		if l.tpm > 0 && l.tokens < need {
+			delay = maxDuration(delay, minutesToDuration((need-l.tokens)/l.tpm))
+		}
+		if delay == 0 {
+			if l.rpm > 0 {
+				l.requests--
+			}
+			if l.tpm > 0 {
+				l.tokens -= need
+			}
+			l.mu.Unlock()
+			return nil
+		}
+		l.mu.Unlock()
+
+		if err := providerSleep(ctx, delay); err != nil {
+			return err
+		}
+	}
+}
+
+func refill(level, perMinute, elapsedMinutes float64) float64 {
+	if perMinute <= 0 {
+		return level
+	}
+	level += perMinute * elapsedMinutes
+	if level > perMinute {
+		level = perMinute
+	}
+	return level
+}
+
+func minutesToDuration(m float64) time.Duration {
+	d := time.Duration(m * float64(time.Minute))
+	if d < time.Millisecond {
+		d = time.Millisecond
+	}
+	return d
+}
+
+func maxDuration(a, b time.Duration) time.Duration {
+	if a > b {
+		return a
+	}
+	return b
+}
+
+// sharedRateLimiters holds one limiter per endpoint, model, API key and
+// configured limits. Limits belong to the account and model, not to a
+// provider instance, and every match builds its own providers -- so a
+// tournament running matches concurrently must draw from one bucket, the
+// same way sharedDecisionCache is shared.
+var sharedRateLimiters = struct {
+	sync.Mutex
+	byKey map[string]*rateLimiter
+}{byKey: map[string]*rateLimiter{}}
+
+// providerRateLimiter returns the shared limiter for config, or nil when
+// neither params.rpm nor params.tpm is set.
+func providerRateLimiter(config ResolvedPlayerModelConfig) *rateLimiter {
+	rpm, tpm := config.Params["rpm"], config.Params["tpm"]
+	if rpm <= 0 && tpm <= 0 {
+		return nil
+	}
+	if rpm < 0 {
+		rpm = 0
+	}
+	if tpm < 0 {
+		tpm = 0
+	}
+	key := fmt.Sprintf("%s\x00%s\x00%s\x00%g\x00%g", config.BaseURL, config.Model, config.APIKey, rpm, tpm)
+	sharedRateLimiters.Lock()
+	defer sharedRateLimiters.Unlock()
+	limiter, ok := sharedRateLimiters.byKey[key]
+	if !ok {
+		limiter = newRateLimiter(rpm, tpm)
+		sharedRateLimiters.byKey[key] = limiter
+	}
+	return limiter
+}
+
+// estimateRequestTokens is what a request is charged against the tpm
+// budget: roughly four characters per prompt token, plus the full completion
+// budget, since providers count max_tokens against the limit up front.
+func estimateRequestTokens(prompt string, maxTokens int) int {
+	return len(prompt)/4 + maxTokens
+}
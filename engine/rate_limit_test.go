@@ -0,0 +1,69 @@
+package engine
+
+import (
+	"context"
+	"testing"
+	"time"
+)
+
+// TestRateLimiterPacesRequestsOncePerMinuteBudgetIsSpent drives the limiter
+// with a fake sleep that moves the limiter's clock back instead of waiting,
+// so the test sees exactly how long each request would have been held.
+func TestRateLimiterPacesRequestsOncePerMinuteBudgetIsSpent(t *testing.T) {
+	limiter := newRateLimiter(2, 1000)
+	var waits []time.Duration
+	restore := providerSleep
+	providerSleep = func(_ context.Context, d time.Duration) error {
+		waits = append(waits, d)
+		limiter.mu.Lock()
+		limiter.lastCheck = limiter.lastCheck.Add(-d)
+		limiter.mu.Unlock()
+		return nil
+	}
+	defer func() { providerSleep = restore }()
+
+	ctx := context.Background()
+	for i := 0; i < 2; i++ {
+		if err := limiter.wait(ctx, 100); err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+	}
+	if len(waits) != 0 {
+		t.Fatalf("expected the first minute's budget to go out without waiting, got %v", waits)
+	}
+
+	if err := limiter.wait(ctx, 100); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(waits) == 0 || waits[0] < 25*time.Second || waits[0] > 31*time.Second {
+		t.Fatalf("expected the third request at 2 rpm to wait about 30s, got %v", waits)
+	}
+
+	// A request estimated at more than the whole tpm budget is charged the
+	// full budget instead of waiting forever.
+	waits = nil
+	if err := limiter.wait(ctx, 5000); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(waits) == 0 {
+		t.Fatalf("expected an oversized request to wait for a full token bucket")
+	}
+}
+
+func TestProviderRateLimiterIsSharedAndOptIn(t *testing.T) {
+	cfg := ResolvedPlayerModelConfig{
+		PlayerModelConfig: PlayerModelConfig{
+			Provider: ProviderOpenAICompatible,
+			Model:    "rate-limit-test-model",
+			BaseURL:  "https://example.invalid/v1/chat/completions",
+		},
+		APIKey: "k",
+	}
+	if providerRateLimiter(cfg) != nil {
+		t.Fatalf("expected no limiter without rpm/tpm")
+	}
+	cfg.Params = map[string]float64{"rpm": 60}
+	if a, b := providerRateLimiter(cfg), providerRateLimiter(cfg); a == nil || a != b {
+		t.Fatalf("expected one shared limiter per endpoint, model and key")
+	}
+}
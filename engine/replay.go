@@ -157,6 +157,10 @@ type MatchResult struct {
 	// so this field is a convenience for callers that only have the
 	// MatchResult and not the raw event slice.
 	ReplayTruncated bool `json:"replay_truncated,omitempty"`
+	// ProviderCacheHits counts turns answered from the decision cache. They
+	// are left out of ProviderCalls and ProviderLatency: no request was made,
+	// and counting them would read as a faster, busier provider.
+	ProviderCacheHits map[string]int `json:"provider_cache_hits,omitempty"`
 	// Strata records what the match actually turned out to be -- realised
 	// lane count, map type, and balance version -- as opposed to what a
 	// ruleset requested. A ruleset with map_type: "" tells you nothing about
@@ -242,12 +246,17 @@ func (g *Game) trimReplayEvents() {
 		"discarded_events": totalDiscarded,
 	}
 
-	rest := g.ReplayEvents[victimEnd:]
-	kept := make([]ReplayEvent, 0, prefixLen+1+len(rest))
-	kept = append(kept, g.ReplayEvents[:prefixLen]...)
-	kept = append(kept, marker)
-	kept = append(kept, rest...)
-	g.ReplayEvents = kept
+	// Compact in place: the marker goes in at prefixLen and the kept tail
+	// slides down behind it. The tail always starts past the marker slot, so
+	// this is a forward memmove into the existing backing array -- once the
+	// cap is reached, every further event would otherwise allocate and copy
+	// a fresh cap-sized slice.
+	g.ReplayEvents[prefixLen] = marker
+	kept := copy(g.ReplayEvents[prefixLen+1:], g.ReplayEvents[victimEnd:])
+	for i := prefixLen + 1 + kept; i < n; i++ {
+		g.ReplayEvents[i] = ReplayEvent{} // release Details maps held by the dropped tail
+	}
+	g.ReplayEvents = g.ReplayEvents[:prefixLen+1+kept]
 	g.ReplayTruncated = true
 }
 
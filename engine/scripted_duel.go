@@ -1,6 +1,9 @@
 package engine
 
-import "time"
+import (
+	"runtime"
+	"time"
+)
 
 // ScriptedDuelConfig describes one offline scripted-vs-scripted match used
 // for balance sweeps and regression tests.
@@ -43,6 +46,7 @@ func RunScriptedDuel(cfg ScriptedDuelConfig) MatchResult {
 		g.SetRandomSeed(cfg.Seed)
 	}
 	g.PauseBetweenTurns = false
+	g.LogsDisabled = true
 	g.AIDecisionInterval[g.Player1] = 0
 	g.AIDecisionInterval[g.Player2] = 0
 
@@ -68,3 +72,19 @@ func RunScriptedDuel(cfg ScriptedDuelConfig) MatchResult {
 	g.ResolveTimeout()
 	return g.BuildMatchResult()
 }
+
+// RunScriptedDuels plays every config and returns the results in the same
+// order as cfgs. Each duel is its own game, so they run side by side, at most
+// concurrency at once; concurrency <= 0 means one per CPU. Results do not
+// depend on the concurrency -- a scripted duel is fully determined by its
+// config.
+func RunScriptedDuels(cfgs []ScriptedDuelConfig, concurrency int) []MatchResult {
+	if concurrency <= 0 {
+		concurrency = runtime.GOMAXPROCS(0)
+	}
+	results := make([]MatchResult, len(cfgs))
+	RunBounded(len(cfgs), concurrency, func(i int) {
+		results[i] = RunScriptedDuel(cfgs[i])
+	})
+	return results
+}
@@ -167,3 +167,26 @@ func TestRunScriptedDuelIsDeterministicAndFast(t *testing.T) {
 		t.Fatalf("expected a resolved or explicitly incomplete duel, got %+v", r1.WinReason)
 	}
 }
+
+func TestRunScriptedDuelsMatchesSequentialRuns(t *testing.T) {
+	cfgs := make([]ScriptedDuelConfig, 0, 4)
+	for _, seed := range []int64{3, 7, 11, 19} {
+		cfgs = append(cfgs, ScriptedDuelConfig{
+			Seed: seed, MaxTicks: 400,
+			Ruleset: BaselineDuelRuleset(), Balance: DefaultBalanceConfig(),
+			DefenderScript: "defender_baseline", AttackerScript: "attacker_baseline",
+		})
+	}
+	parallel := RunScriptedDuels(cfgs, 4)
+	if len(parallel) != len(cfgs) {
+		t.Fatalf("expected %d results, got %d", len(cfgs), len(parallel))
+	}
+	for i, cfg := range cfgs {
+		want := RunScriptedDuel(cfg)
+		got := parallel[i]
+		if got.Winner != want.Winner || got.Ticks != want.Ticks || got.Score[got.Defender] != want.Score[want.Defender] {
+			t.Fatalf("seed %d: parallel run %s/%d/%d differs from sequential %s/%d/%d",
+				cfg.Seed, got.Winner, got.Ticks, got.Score[got.Defender], want.Winner, want.Ticks, want.Score[want.Defender])
+		}
+	}
+}
@@ -1,6 +1,9 @@
 package engine
 
-import "testing"
+import (
+	"math"
+	"testing"
+)
 
 func TestEnemySpatialIndexReturnsOnlyNearbyEnemies(t *testing.T) {
 	g := NewGame("test", "test")
@@ -36,3 +39,51 @@ func TestTowerAttackUsesSpatialIndexCandidates(t *testing.T) {
 		t.Fatalf("expected far enemy to be untouched")
 	}
 }
+
+// TestWithinRangeMatchesEuclideanDistance guards the squared-distance range
+// check against the sqrt form it replaced: on integer tiles they must select
+// exactly the same cells for every range a tower or vision radius can have.
+func TestWithinRangeMatchesEuclideanDistance(t *testing.T) {
+	origin := Position{Y: 0, X: 0}
+	for r := 0; r <= 15; r++ {
+		for dy := -20; dy <= 20; dy++ {
+			for dx := -20; dx <= 20; dx++ {
+				p := Position{Y: dy, X: dx}
+				want := math.Sqrt(float64(dy*dy+dx*dx)) <= float64(r)
+				if got := withinRange(origin, p, r); got != want {
+					t.Fatalf("withinRange(%v, r=%d) = %v, want %v", p, r, got, want)
+				}
+			}
+		}
+	}
+}
+
+// TestEnemiesNearReturnsStackedEnemiesOnceWithoutAllocating covers the two
+// things enemiesNear relies on now that it has no dedup set: enemies sharing
+// a tile each come back exactly once, and a query over an empty neighbourhood
+// -- what most towers see most ticks -- allocates nothing.
+func TestEnemiesNearReturnsStackedEnemiesOnceWithoutAllocating(t *testing.T) {
+	g := NewGame("test", "test")
+	a := NewEnemy(5, 6, "basic", nil)
+	b := NewEnemy(5, 6, "tank", nil)
+	c := NewEnemy(6, 6, "basic", nil)
+	g.Enemies = []*Enemy{&a, &b, &c}
+	g.rebuildEnemySpatialIndex()
+
+	got := g.enemiesNear(Position{Y: 5, X: 5}, 3)
+	if len(got) != 3 {
+		t.Fatalf("expected each of the 3 enemies once, got %d", len(got))
+	}
+	seen := map[*Enemy]bool{}
+	for _, e := range got {
+		if seen[e] {
+			t.Fatalf("enemy at %v returned twice", e.Pos)
+		}
+		seen[e] = true
+	}
+
+	empty := Position{Y: 5, X: 30}
+	if allocs := testing.AllocsPerRun(100, func() { g.enemiesNear(empty, 3) }); allocs != 0 {
+		t.Fatalf("expected no allocations for an empty neighbourhood, got %v", allocs)
+	}
+}
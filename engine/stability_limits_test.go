@@ -19,3 +19,11 @@ func TestLogfRespectsMaxLogs(t *testing.T) {
 	}
 }
 
+func TestLogfDropsMessagesWhenLogsDisabled(t *testing.T) {
+	g := NewGame("test", "test")
+	g.LogsDisabled = true
+	g.logf("%s", "a")
+	if len(g.Logs) != 0 {
+		t.Fatalf("expected no logs while disabled, got %#v", g.Logs)
+	}
+}
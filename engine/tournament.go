@@ -8,6 +8,11 @@ type TournamentConfig struct {
 	Ruleset  *ArenaRuleset       `json:"ruleset,omitempty"`
 	RoleSwap bool                `json:"role_swap"`
 	Matchups []TournamentMatchup `json:"matchups"`
+	// Concurrency caps how many matches are played at once. Live matches
+	// are network-bound, so overlapping them cuts wall clock roughly in
+	// proportion -- until the provider's rate limit is the bottleneck.
+	// 0 or 1 plays them one after another, as before. See RunBounded.
+	Concurrency int `json:"concurrency,omitempty"`
 }
 
 type TournamentMatchup struct {
@@ -569,17 +569,33 @@ func runTournament(path, ratingsPath, csvPath, mdPath string) error {
 		return err
 	}
 
-	report := eng.TournamentReport{Name: config.Name}
+	// Every matchup's config is resolved before any match starts. Resolution
+	// is the only step that can fail, and finding a missing API key after the
+	// fan-out would mean every other scheduled match -- live, billed calls
+	// included -- had already run for a tournament that then reports nothing.
+	type tournamentRun struct {
+		matchup   eng.TournamentMatchup
+		resolved  eng.ResolvedMatchConfig
+		scheduled eng.TournamentScheduledRun
+	}
+	runs := make([]tournamentRun, 0)
 	for _, matchup := range config.Matchups {
+		resolved, err := eng.ResolveMatchConfig(eng.MatchConfig{Player1: matchup.Player1, Player2: matchup.Player2})
+		if err != nil {
+			return err
+		}
 		for _, scheduled := range eng.BuildTournamentSchedule(config) {
-			result, manifest, err := runTournamentMatch(matchup, scheduled.Seed, config, scheduled.Swapped)
-			if err != nil {
-				return err
-			}
-			report.Results = append(report.Results, result)
-			report.Manifests = append(report.Manifests, manifest)
+			runs = append(runs, tournamentRun{matchup: matchup, resolved: resolved, scheduled: scheduled})
 		}
 	}
+	results := make([]eng.TournamentMatchResult, len(runs))
+	manifests := make([]eng.ArenaRunManifest, len(runs))
+	eng.RunBounded(len(runs), config.Concurrency, func(i int) {
+		run := runs[i]
+		results[i], manifests[i] = runTournamentMatch(run.matchup, run.resolved, run.scheduled.Seed, config, run.scheduled.Swapped)
+	})
+
+	report := eng.TournamentReport{Name: config.Name, Results: results, Manifests: manifests}
 	report.Standings = eng.SortStandings(eng.BuildTournamentStandings(report.Results))
 	ratings := eng.DefaultModelRatings()
 	if ratingsPath != "" {
@@ -657,14 +673,10 @@ func applyGameConfiguration(g *eng.Game, mapType string, maxWaves int, rulesets
 	return appliedRuleset
 }
 
-func runTournamentMatch(matchup eng.TournamentMatchup, seed int64, config eng.TournamentConfig, swapped bool) (eng.TournamentMatchResult, eng.ArenaRunManifest, error) {
-	matchConfig := eng.MatchConfig{Player1: matchup.Player1, Player2: matchup.Player2}
-	resolved, err := eng.ResolveMatchConfig(matchConfig)
-	if err != nil {
-		return eng.TournamentMatchResult{}, eng.ArenaRunManifest{}, err
-	}
+func runTournamentMatch(matchup eng.TournamentMatchup, resolved eng.ResolvedMatchConfig, seed int64, config eng.TournamentConfig, swapped bool) (eng.TournamentMatchResult, eng.ArenaRunManifest) {
 	g := eng.NewGameFromResolvedConfig(resolved)
 	g.PauseBetweenTurns = false
+	g.LogsDisabled = true
 	g.AIDecisionInterval[g.Defender] = 0
 	g.AIDecisionInterval[g.Attacker] = 0
 	var rulesets []eng.ArenaRuleset
@@ -686,7 +698,7 @@ func runTournamentMatch(matchup eng.TournamentMatchup, seed int64, config eng.To
 		Result:  g.BuildMatchResult(),
 	}
 	manifest := eng.BuildRunManifest("tournament", g, seed, swapped, maxTicks, appliedRuleset, os.Getenv("GIT_COMMIT"))
-	return result, manifest, nil
+	return result, manifest
 }
 
 func writeJSONFile(path string, v interface{}) error {